@@ -6,6 +6,8 @@ import time
 SERIAL_PORT = "COM5"  # Update this to match your setup
 BAUD_RATE = 115200
 HEADER_BYTE = 0xF5 # 아두이노에서 보낼 헤더 바이트 (예시)
+# 10개의 short (2바이트, big-endian) = 20바이트. 포맷을 한 번만 컴파일해 두고 매 패킷마다 재사용
+PACKET_STRUCT = struct.Struct(">10h")
 
 def read_mpu_data():
     ser = None # ser 변수를 미리 선언하여 finally 블록에서 접근 가능하도록 함
@@ -28,7 +30,7 @@ def read_mpu_data():
                     data = remaining_data[0:20] # 헤더 다음 2바이트를 건너뛰고 20바이트 추출
                     try:
                         # ">hhhhhhhhhh"는 10개의 short (2바이트) 값을 나타내므로 총 20바이트
-                        accelX, accelY, accelZ, gX, gY, gZ, e1, e2, e3, e4 = struct.unpack(">hhhhhhhhhh", data)
+                        accelX, accelY, accelZ, gX, gY, gZ, e1, e2, e3, e4 = PACKET_STRUCT.unpack(data)
                         print(f"Accel: X={accelX}, Y={accelY}, Z={accelZ}")
                         # 필요한 경우 나머지 e1, e2, e3, e4 값도 출력 가능
                     except struct.error as se:
@@ -6,6 +6,8 @@ import time
 SERIAL_PORT = "COM5"  # Update this to match your setup
 BAUD_RATE = 115200
 HEADER_BYTE = 0xF5 # 아두이노에서 보낼 헤더 바이트 (예시)
+# 10개의 short (2바이트, big-endian) = 20바이트. 포맷을 한 번만 컴파일해 두고 매 패킷마다 재사용
+PACKET_STRUCT = struct.Struct(">10h")
 
 def read_mpu_data():
     ser = None # ser 변수를 미리 선언하여 finally 블록에서 접근 가능하도록 함
@@ -27,14 +29,14 @@ def read_mpu_data():
                 if len(data) == 20:
                     try:
                         # ">hhhhhhhhhh"는 10개의 short (2바이트) 값을 나타내므로 총 20바이트
-                        accelX, accelY, accelZ, gX, gY, gZ, e1, e2, e3, e4 = struct.unpack(">hhhhhhhhhh", data)
+                        accelX, accelY, accelZ, gX, gY, gZ, e1, e2, e3, e4 = PACKET_STRUCT.unpack(data)
                         print(f"Accel: X={accelX}, Y={accelY}, Z={accelZ}")
                         # 필요한 경우 나머지 e1, e2, e3, e4 값도 출력 가능
                     except struct.error as se:
                         print(f"Struct unpack error: {se}. Data length: {len(data)}. Data: {data.hex()}")
                         # unpack 오류 발생 시, 어떤 데이터가 문제였는지 확인하기 위함
                 else:
-                    print(f"Incomplete packet received. Expected 22 bytes after header, got {len(remaining_data)} bytes.")
+                    print(f"Incomplete packet received. Expected 22 bytes after header, got {len(data)} bytes.")
                     # 불완전한 패킷 수신 시 경고
             # else: # 헤더 바이트가 아닐 경우 다음 바이트를 계속 확인
             #     print(f"Skipping byte: {ord(byte)}") # 디버깅용: 스킵하는 바이트 확인
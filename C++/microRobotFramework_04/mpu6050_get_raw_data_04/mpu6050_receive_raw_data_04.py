@@ -4,6 +4,11 @@ import struct
 # Set the serial port (Change to your actual port, e.g., COM3 on Windows or /dev/ttyUSB0 on Linux/macOS)
 SERIAL_PORT = "/dev/ttyUSB0"  # Update this to match your setup
 BAUD_RATE = 115200
+HEADER_BYTE = 0xF5
+PACKET_SIZE = 23  # header + length + 20 data bytes + checksum
+
+# 10 big-endian shorts (20 bytes); compiled once instead of parsing the format every packet
+PACKET_STRUCT = struct.Struct(">10h")
 
 def read_mpu_data():
     try:
@@ -11,10 +16,22 @@ def read_mpu_data():
         print(f"Connected to {SERIAL_PORT} at {BAUD_RATE} baud.")
 
         while True:
-            # Look for the header byte 0xF5
-            packet = ser.read(23)
-            data = packet[2:22]
-            accelX, accelY, accelZ, gX, gY, gZ, e1, e2, e3, e4 = struct.unpack(">hhhhhhhhhh", data)
+            packet = ser.read(PACKET_SIZE)
+            if len(packet) < PACKET_SIZE:
+                continue  # Timed out before a whole packet arrived
+
+            # Look for the header byte 0xF5; if the packet is misaligned, drop the bytes
+            # before the next header and read the rest of that packet
+            if packet[0] != HEADER_BYTE:
+                start = packet.find(HEADER_BYTE, 1)
+                if start < 0:
+                    continue
+                packet = packet[start:] + ser.read(start)
+                if len(packet) < PACKET_SIZE:
+                    continue
+
+            # Unpack the 20 data bytes straight from the packet (skip header and length)
+            accelX, accelY, accelZ, gX, gY, gZ, e1, e2, e3, e4 = PACKET_STRUCT.unpack_from(packet, 2)
             print(accelX, accelY, accelZ)
            
     except serial.SerialException as e:
@@ -4,11 +4,19 @@ Python version of the microRobotFramework C++ class for 2-wheel robot control
 Converted from microRobotFramework.hpp and microRobotFramework.cpp
 """
 
+import array
+import os
+import select
+import selectors
 import serial
 import struct
+import sys
 import time
 import errno
-from typing import Optional, Tuple
+import logging
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
 
 
 class MRF:
@@ -17,8 +25,17 @@ class MRF:
     Handles serial communication, sensor data reception (IMU + Encoder)
     """
 
+    # Fixed attribute layout: no per-instance __dict__
+    __slots__ = ('serial_port', 'baud_rate', 'connected', 'serial_connection', 'sensor_array',
+                 '_sensor', '_sensor_bytes', '_rx_buf', '_rx_mv', '_error_count', '_fd')
+
     # Constants
-    HEADER_BYTE = 0xF5  # Header byte for serial communication
+    HEADER_BYTE = 0xF5  # Header byte for sensor data reception
+    PACKET_SIZE = 21  # 1 header byte + 20 data bytes
+    _SWAP_BYTES = sys.byteorder == 'little'  # Packet data is big-endian
+
+    # Precompiled packet layouts
+    _PACKET_STRUCT = struct.Struct('>B10h')  # Header + 10 big-endian int16 values
 
     def __init__(self, port: str, baud_rate: int):
         """
@@ -32,20 +49,21 @@ class MRF:
         self.baud_rate = baud_rate
         self.connected = False
         self.serial_connection: Optional[serial.Serial] = None
+        self._fd: Optional[int] = None  # Raw file descriptor of the port (POSIX only)
+        self._error_count = 0  # Receive/parse errors, see error_count
 
-        # IMU Data
-        self.accel_x = 0
-        self.accel_y = 0
-        self.accel_z = 0
-        self.gyro_x = 0
-        self.gyro_y = 0
-        self.gyro_z = 0
+        # Sensor Data: accel x/y/z, gyro x/y/z, encoder 1-4
+        # Parsed in place, so no objects are allocated per packet
+        self._sensor = array.array('h', bytes(20))
+        self._sensor_bytes = memoryview(self._sensor).cast('B')
 
-        # Encoder Data
-        self.encoder1 = 0
-        self.encoder2 = 0
-        self.encoder3 = 0
-        self.encoder4 = 0
+        # Zero-copy int16 view of all 10 sensor values, updated in place by every packet
+        # NumPy users can wrap it once: np.frombuffer(mrf.sensor_array, dtype=np.int16)
+        self.sensor_array = memoryview(self._sensor)
+
+        # Receive buffer reused for every packet
+        self._rx_buf = bytearray(self.PACKET_SIZE)
+        self._rx_mv = memoryview(self._rx_buf)
 
         # Initialize serial connection
         self.connected = self._open_serial()
@@ -66,6 +84,20 @@ class MRF:
                 parity=serial.PARITY_NONE,
                 stopbits=serial.STOPBITS_ONE
             )
+
+            # Deliver received bytes immediately instead of after the driver's
+            # latency timer (16ms by default on Linux USB-serial adapters)
+            try:
+                self.serial_connection.set_low_latency_mode(True)
+            except (AttributeError, ValueError, OSError):
+                pass  # Not supported on this platform or driver
+
+            # Raw descriptor for reading straight into the receive buffer; pyserial is used without it
+            try:
+                self._fd = self.serial_connection.fileno()
+            except (AttributeError, ValueError, OSError):
+                self._fd = None
+
             return True
         except (serial.SerialException, OSError) as e:
             print(f"Error opening serial port {self.serial_port}: {e}")
@@ -80,10 +112,38 @@ class MRF:
         """
         return self.connected and self.serial_connection is not None and self.serial_connection.is_open
 
+    @property
+    def error_count(self) -> int:
+        """Number of receive/parse errors so far (details are logged at DEBUG level)"""
+        return self._error_count
+
+    def fileno(self) -> int:
+        """
+        Get the file descriptor of the serial port (POSIX only)
+        Allows an MRF instance to be used directly with select/selectors
+
+        Returns:
+            int: File descriptor of the open serial port
+        """
+        return self.serial_connection.fileno()
+
+    def register(self, selector: selectors.BaseSelector) -> None:
+        """
+        Register the serial port with a selector so one thread can serve several robots
+        The MRF instance is stored as the key data:
+
+            for key, _ in selector.select(timeout=0.1):
+                key.data.drain_and_parse()
+
+        Args:
+            selector (selectors.BaseSelector): Selector to register with
+        """
+        selector.register(self, selectors.EVENT_READ, self)
+
     def receive_sensor_data(self) -> bool:
         """
         Receive sensor data from serial port (IMU + Encoder data)
-        Reads 21 bytes total: 1 header byte + 20 data bytes
+        Reads 21 bytes total: 1 header byte (0xF5) + 20 data bytes
 
         Returns:
             bool: True if data received successfully, False otherwise
@@ -92,89 +152,232 @@ class MRF:
             return False
 
         try:
-            # 1. Find header byte (0xF5)
+            # 1. Read a whole packet at once and resync on the header byte (0xF5)
+            rx_buf = self._rx_buf
+            rx_mv = self._rx_mv
+            received = 0
             while True:
-                header_byte = self.serial_connection.read(1)
-                if len(header_byte) == 0:  # Timeout
+                count = self._read_into(rx_mv[received:])
+                if not count:  # Timeout or incomplete packet
                     return False
 
-                if header_byte[0] == self.HEADER_BYTE:
-                    break  # Header found
+                received += count
+                header_index = rx_buf.find(self.HEADER_BYTE, 0, received)
+                if header_index < 0:
+                    received = 0  # No header in what we read, discard it
+                elif header_index > 0:
+                    # Move the header and what follows it to the front of the buffer
+                    received -= header_index
+                    rx_mv[:received] = rx_mv[header_index:header_index + received]
+
+                if received == self.PACKET_SIZE:
+                    break  # Full packet starting with the header
 
-            # 2. Read remaining 22 bytes of data, extract 20 bytes excluding length
-            data = self.serial_connection.read(20)
-            #data = remaining_data[0:20]
-        
-            # 3. Parse the data
-            self._parse_sensor_data(data)
+            # 2. Parse the 20 data bytes following the header
+            self._parse_sensor_data(rx_mv[1:])
             return True
 
         except (serial.SerialException, OSError) as e:
-            print(f"Error reading serial data: {e}")
+            self._error_count += 1
+            logger.debug("Error reading serial data: %s", e)
             return False
 
-    def _parse_sensor_data(self, data_buffer: bytes) -> None:
+    def _read_into(self, view: memoryview) -> int:
         """
-        Parse sensor data from buffer
-        Data format: 6 int16 values (IMU) + 4 uint16 values (Encoders)
+        Read into view, blocking until it is full or the port timeout expires
+        Uses os.readv on the raw file descriptor when available, so no bytes object is created
+        (pyserial's readinto reads into a new bytes object and copies it)
 
         Args:
-            data_buffer (bytes): 20-byte data buffer
-        """
-        try:
-            self.accel_x, self.accel_y, self.accel_z, self.gyro_x, self.gyro_y, self.gyro_z, self.encoder1, self.encoder2, self.encoder3, self.encoder4 = struct.unpack(">hhhhhhhhhh", data_buffer)
-
-        except struct.error as e:
-            print(f"Error parsing sensor data: {e}")
-
-    # Getter methods for IMU data
-    def get_accel_x(self) -> int:
-        """Get X-axis acceleration"""
-        return self.accel_x
+            view (memoryview): Writable target buffer
 
-    def get_accel_y(self) -> int:
-        """Get Y-axis acceleration"""
-        return self.accel_y
-
-    def get_accel_z(self) -> int:
-        """Get Z-axis acceleration"""
-        return self.accel_z
+        Returns:
+            int: Number of bytes read (less than len(view) on timeout)
+        """
+        fd = self._fd
+        if fd is None:
+            return self.serial_connection.readinto(view)
+
+        size = len(view)
+        received = 0
+        deadline = None
+        readable = False  # select() reported data that the last read hasn't returned yet
+        while received < size:
+            try:
+                count = os.readv(fd, (view[received:],))
+            except BlockingIOError:
+                count = 0  # Port is non-blocking and nothing has arrived yet
+
+            if count:
+                received += count
+                readable = False
+                continue
+            if readable:
+                # Readable but empty: the device was disconnected
+                raise serial.SerialException("device reports readiness to read but returned no data")
+
+            # Wait for more data until the port timeout expires
+            if deadline is None:
+                deadline = time.monotonic() + self.serial_connection.timeout
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select((fd,), (), (), remaining)[0]:
+                break
+            readable = True
+        return received
+
+    def drain_and_parse(self) -> int:
+        """
+        Parse every packet already waiting in the serial buffer with a single read
+        Only the most recent packet is kept as the current sensor data
 
-    def get_gyro_x(self) -> int:
-        """Get X-axis gyroscope data"""
-        return self.gyro_x
+        Returns:
+            int: Number of complete packets consumed (0 if none)
+        """
+        if not self.is_connected():
+            return 0
 
-    def get_gyro_y(self) -> int:
-        """Get Y-axis gyroscope data"""
-        return self.gyro_y
+        try:
+            pending = self.serial_connection.in_waiting
+            if pending == 0:
+                return 0
+            data = self.serial_connection.read(pending)
+
+            packets = 0
+            latest = -1
+            index = data.find(self.HEADER_BYTE)
+            while index >= 0:
+                missing = index + self.PACKET_SIZE - len(data)
+                if missing > 0:
+                    # Last packet is cut off, read the rest of it so the stream stays aligned
+                    remaining_data = self.serial_connection.read(missing)
+                    if len(remaining_data) != missing:
+                        break  # Incomplete packet
+                    data += remaining_data
+
+                latest = index
+                packets += 1
+                index = data.find(self.HEADER_BYTE, index + self.PACKET_SIZE)  # Skip garbage in one C-level scan
+
+            if latest >= 0:
+                self._parse_sensor_data(memoryview(data)[latest + 1:latest + self.PACKET_SIZE])
+            return packets
 
-    def get_gyro_z(self) -> int:
-        """Get Z-axis gyroscope data"""
-        return self.gyro_z
+        except (serial.SerialException, OSError) as e:
+            self._error_count += 1
+            logger.debug("Error reading serial data: %s", e)
+            return 0
 
-    # Getter methods for Encoder data
-    def get_encoder1(self) -> int:
-        """Get encoder 1 value"""
-        return self.encoder1
+    @classmethod
+    def parse_sensor_log(cls, raw: bytes) -> List[Tuple[int, ...]]:
+        """
+        Parse a recorded stream of sensor packets in bulk (e.g. raw bytes logged from the serial port)
+        Aligned runs of packets are decoded by struct.iter_unpack in C; misaligned bytes are skipped
 
-    def get_encoder2(self) -> int:
-        """Get encoder 2 value"""
-        return self.encoder2
+        Args:
+            raw (bytes): Raw byte stream of consecutive 21-byte packets
 
-    def get_encoder3(self) -> int:
-        """Get encoder 3 value"""
-        return self.encoder3
+        Returns:
+            List[Tuple[int, ...]]: (accel_x, accel_y, accel_z, gyro_x, gyro_y, gyro_z,
+                                    encoder1, encoder2, encoder3, encoder4) for each packet
+        """
+        samples = []
+        data = memoryview(raw)
+        start = raw.find(cls.HEADER_BYTE)
+        while start >= 0:
+            end = start + (len(raw) - start) // cls.PACKET_SIZE * cls.PACKET_SIZE
+            for packet in cls._PACKET_STRUCT.iter_unpack(data[start:end]):
+                if packet[0] != cls.HEADER_BYTE:
+                    break  # Lost alignment, resync on the next header
+                samples.append(packet[1:])
+                start += cls.PACKET_SIZE
+            else:
+                break  # Reached the end of the stream
+
+            start = raw.find(cls.HEADER_BYTE, start + 1)
+
+        return samples
+
+    def _parse_sensor_data(self, data_buffer: memoryview) -> None:
+        """
+        Parse sensor data from buffer
+        Data format: 10 big-endian int16 values (6 IMU + 4 Encoders)
 
-    def get_encoder4(self) -> int:
-        """Get encoder 4 value"""
-        return self.encoder4
+        Args:
+            data_buffer (memoryview): 20-byte data buffer
+        """
+        try:
+            # Copy the raw payload into the sensor array, then convert big-endian to host order
+            self._sensor_bytes[:] = data_buffer
+            if self._SWAP_BYTES:
+                self._sensor.byteswap()
+
+        except ValueError as e:
+            self._error_count += 1
+            logger.debug("Error parsing sensor data: %s", e)
+
+    # IMU data (read-only views into the sensor array)
+    @property
+    def accel_x(self) -> int:
+        """X-axis acceleration"""
+        return self._sensor[0]
+
+    @property
+    def accel_y(self) -> int:
+        """Y-axis acceleration"""
+        return self._sensor[1]
+
+    @property
+    def accel_z(self) -> int:
+        """Z-axis acceleration"""
+        return self._sensor[2]
+
+    @property
+    def gyro_x(self) -> int:
+        """X-axis gyroscope data"""
+        return self._sensor[3]
+
+    @property
+    def gyro_y(self) -> int:
+        """Y-axis gyroscope data"""
+        return self._sensor[4]
+
+    @property
+    def gyro_z(self) -> int:
+        """Z-axis gyroscope data"""
+        return self._sensor[5]
+
+    # Encoder data (read-only views into the sensor array)
+    @property
+    def encoder1(self) -> int:
+        """Encoder 1 value"""
+        return self._sensor[6]
+
+    @property
+    def encoder2(self) -> int:
+        """Encoder 2 value"""
+        return self._sensor[7]
+
+    @property
+    def encoder3(self) -> int:
+        """Encoder 3 value"""
+        return self._sensor[8]
+
+    @property
+    def encoder4(self) -> int:
+        """Encoder 4 value"""
+        return self._sensor[9]
 
     def close_connection(self) -> None:
         """Close serial connection"""
+        self._fd = None
         if self.serial_connection and self.serial_connection.is_open:
             self.serial_connection.close()
         self.connected = False
 
-    def __del__(self):
-        """Destructor - ensure serial connection is closed"""
+    def __enter__(self) -> "MRF":
+        """Context manager entry - use as `with MRF(port, baud_rate) as mrf:`"""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Context manager exit - ensure serial connection is closed"""
         self.close_connection()
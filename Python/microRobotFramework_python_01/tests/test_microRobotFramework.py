@@ -0,0 +1,123 @@
+"""
+Tests for microRobotFramework
+Run from the microRobotFramework_python_01 directory:
+    python -m unittest discover -s tests
+"""
+
+import os
+import struct
+import sys
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import microRobotFramework as mrf_module
+
+
+def _packet(values) -> bytes:
+    """Build a 21-byte sensor packet: header 0xF5 + 10 big-endian int16 values"""
+    return b'\xf5' + struct.pack('>10h', *values)
+
+
+@unittest.skipUnless(os.name == 'posix', "needs a pseudo-terminal")
+class PtyTestCase(unittest.TestCase):
+    """Runs an MRF on a pseudo-terminal; bytes written to self.master arrive at the MRF"""
+
+    def setUp(self):
+        import pty
+        import tty
+        self.master, slave = pty.openpty()
+        tty.setraw(self.master)
+        self.mrf = mrf_module.MRF(os.ttyname(slave), 115200)
+        os.close(slave)  # The MRF opened its own descriptor for the port
+        self.assertTrue(self.mrf.is_connected())
+
+    def tearDown(self):
+        self.mrf.close_connection()
+        if self.master is not None:
+            os.close(self.master)
+
+    def send(self, data: bytes) -> None:
+        os.write(self.master, data)
+        time.sleep(0.02)  # Let the bytes reach the MRF's side of the pty
+
+
+class ReceiveTest(PtyTestCase):
+    """receive_sensor_data: one packet per call, resynced on the header byte"""
+
+    def test_reads_packet_values(self):
+        values = [-1, 2, -3, 4, 5, -6, 7, 32767, -32768, 10]
+        self.send(_packet(values))
+
+        self.assertTrue(self.mrf.receive_sensor_data())
+        self.assertEqual(list(self.mrf.sensor_array), values)
+        self.assertEqual((self.mrf.accel_x, self.mrf.gyro_z, self.mrf.encoder4), (-1, -6, 10))
+        self.assertEqual(self.mrf.error_count, 0)
+
+    def test_skips_bytes_before_the_header(self):
+        self.send(b'\x01\x02\x03' + _packet(range(10)) + _packet(range(10, 20)))
+
+        self.assertTrue(self.mrf.receive_sensor_data())
+        self.assertEqual(list(self.mrf.sensor_array), list(range(10)))
+        self.assertTrue(self.mrf.receive_sensor_data())
+        self.assertEqual(list(self.mrf.sensor_array), list(range(10, 20)))
+
+    def test_packet_split_across_reads(self):
+        packet = _packet(range(30, 40))
+        self.send(packet[:7])
+        self.assertFalse(self.mrf.receive_sensor_data())  # Times out on the incomplete packet
+
+        self.send(packet)
+        self.assertTrue(self.mrf.receive_sensor_data())
+        self.assertEqual(list(self.mrf.sensor_array), list(range(30, 40)))
+
+    def test_unplugged_device_counts_an_error(self):
+        os.close(self.master)
+        self.master = None
+
+        self.assertFalse(self.mrf.receive_sensor_data())
+        self.assertEqual(self.mrf.error_count, 1)
+
+
+class DrainAndParseTest(PtyTestCase):
+    """drain_and_parse: every waiting packet in one read, the latest one kept"""
+
+    def test_nothing_waiting(self):
+        self.assertEqual(self.mrf.drain_and_parse(), 0)
+
+    def test_keeps_the_latest_packet(self):
+        self.send(b'\x00' + _packet(range(10)) + b'\x11\x22' + _packet(range(10, 20)) + _packet(range(20, 30)))
+
+        self.assertEqual(self.mrf.drain_and_parse(), 3)
+        self.assertEqual(list(self.mrf.sensor_array), list(range(20, 30)))
+        self.assertEqual(self.mrf.drain_and_parse(), 0)
+
+    def test_incomplete_last_packet(self):
+        self.send(_packet(range(10)) + _packet(range(10, 20))[:9])
+
+        self.assertEqual(self.mrf.drain_and_parse(), 1)
+        self.assertEqual(list(self.mrf.sensor_array), list(range(10)))
+
+
+class ParseSensorLogTest(unittest.TestCase):
+    """parse_sensor_log: bulk decoding of a recorded byte stream"""
+
+    def test_aligned_stream(self):
+        samples = [tuple(range(start, start + 10)) for start in range(0, 50, 10)]
+        raw = b''.join(_packet(sample) for sample in samples)
+
+        self.assertEqual(mrf_module.MRF.parse_sensor_log(raw), samples)
+
+    def test_resyncs_after_garbage(self):
+        first, second, third = tuple(range(10)), tuple(range(-10, 0)), tuple(range(100, 110))
+        raw = b'\x00\x01' + _packet(first) + b'\x02' + _packet(second) + _packet(third) + _packet(first)[:12]
+
+        self.assertEqual(mrf_module.MRF.parse_sensor_log(raw), [first, second, third])
+
+    def test_empty_stream(self):
+        self.assertEqual(mrf_module.MRF.parse_sensor_log(b''), [])
+        self.assertEqual(mrf_module.MRF.parse_sensor_log(b'\x00' * 30), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -17,8 +17,6 @@ Version 2.0 Features:
 - ✅ Cross-platform support
 """
 
-from .microRobotFramework_02 import MRF
-
 __version__ = "2.0.0"
 __author__ = "JD-edu"
 __email__ = ""
@@ -29,6 +27,14 @@ __all__ = [
     'MRF',
 ]
 
+# Lazy import: pyserial is only loaded when MRF is first accessed (PEP 562)
+def __getattr__(name):
+    """Load MRF on first access"""
+    if name == 'MRF':
+        from .microRobotFramework_02 import MRF
+        return MRF
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # Version info
 VERSION = (2, 0, 0)
 VERSION_STRING = '.'.join(map(str, VERSION))
@@ -100,7 +106,7 @@ microRobotFramework v{__version__} - Quick Start
 
    # Read sensor data
    if mrf.receive_sensor_data():
-       print(f"Accel X: {{mrf.get_accel_x()}}")
+       print(f"Accel X: {{mrf.accel_x}}")
 
    # Send motor command
    mrf.send_motor_command(100, 0)  # speed=100, angle=0
@@ -7,26 +7,30 @@ Converted from mrf_example_02.cpp
 This example demonstrates:
 - Connect to serial port
 - Continuously read sensor data (IMU + Encoder)
-- Display accelerometer data
-- Send motor control commands periodically (every 100 sensor readings)
+- Display accelerometer data (every 10th update)
+- Send motor control commands periodically (every 100 ms)
 - Prevent serial buffer overflow with proper timing
 
 Usage:
     python3 mrf_example_02.py
 """
 
-import time
+import selectors
 import sys
+import time
 from microRobotFramework_02 import MRF
 
+MOTOR_COMMAND_INTERVAL = 0.1  # Seconds between motor commands in main() (cooling down)
+DISPLAY_EVERY = 10  # Print every Nth sensor update in main()
+
+# Preformatted display line: accel x/y/z
+_ACCEL_FMT = '{:6d}  {:6d}  {:6d}\n'.format
+
 
 def main():
     """
     Main function - equivalent to C++ main()
     """
-    count = 0
-    ret = False
-
     # Initialize MRF with serial port and baud rate
     # Note: You may need to change '/dev/ttyACM0' to your actual serial port
     # On Windows, it might be 'COM3', 'COM4', etc.
@@ -44,26 +48,45 @@ def main():
 
     print("✅ Serial connection established!")
     print("📡 Starting sensor data reception with motor control...")
-    print("🎮 Motor commands will be sent every 100 sensor readings")
+    print(f"🎮 Motor commands will be sent every {MOTOR_COMMAND_INTERVAL:g} s")
     print("Press Ctrl+C to stop")
     print("-" * 60)
 
+    # Wake up only when the serial port has data (POSIX)
+    # Where the port can't be selected on (e.g. Windows), fall back to blocking reads
+    selector = selectors.DefaultSelector()
+    try:
+        mrf.register(selector)
+        select = selector.select
+    except (AttributeError, ValueError, OSError):
+        select = None
+
+    # Bind hot-loop lookups once: methods and the live sensor value view
+    receive = mrf.receive_sensor_data
+    drain = mrf.drain_and_parse
+    send = mrf.send_motor_command
+    sensor = mrf.sensor_array  # accel x/y/z, gyro x/y/z, encoder 1-4
+    monotonic = time.monotonic
+    write = sys.stdout.write
+    last_motor_command = monotonic()
+    count = 0
+
     try:
         # Main loop - equivalent to C++ while(true) loop
         while True:
-            # Receive sensor data
-            ret = mrf.receive_sensor_data()
+            # Receive sensor data: parse everything that arrived, or time out after 100ms
+            if select is not None:
+                ret = bool(select(timeout=0.1)) and drain() > 0
+            else:
+                ret = receive()
 
             if ret:
-                # Display accelerometer data (same as C++ example)
-                accel_x = mrf.get_accel_x()
-                accel_y = mrf.get_accel_y()
-                accel_z = mrf.get_accel_z()
-
-                print(f"{accel_x:6d}  {accel_y:6d}  {accel_z:6d}")
-
-            # Sleep for 1ms (equivalent to C++ usleep(1000))
-            time.sleep(0.001)
+                # Display accelerometer data (same as C++ example), decimated to keep
+                # terminal output from dominating the loop
+                count += 1
+                if count >= DISPLAY_EVERY:
+                    write(_ACCEL_FMT(sensor[0], sensor[1], sensor[2]))
+                    count = 0
 
             # Motor control logic - equivalent to C++ cooling down mechanism
             """
@@ -72,16 +95,15 @@ def main():
             Below code is just study and test purpose only. 
             Use thread to receiving IMU and send motor command at same time 
             """
-            if count > 100:
+            now = monotonic()
+            if now - last_motor_command >= MOTOR_COMMAND_INTERVAL:
                 # Send motor command: speed=90, angle=100
-                motor_success = mrf.send_motor_command(100, 0)
+                motor_success = send(100, 0)
                 if motor_success:
                     print(f"🎮 Motor command sent: speed=90, angle=100")
                 else:
                     print("❌ Failed to send motor command")
-                count = 0
-            else:
-                count += 1
+                last_motor_command = now
 
     except KeyboardInterrupt:
         print("\n🛑 Program interrupted by user")
@@ -89,7 +111,8 @@ def main():
         print(f"❌ Error occurred: {e}")
         return 1
     finally:
-        # Clean up - close serial connection
+        # Clean up - close selector and serial connection
+        selector.close()
         mrf.close_connection()
         print("🔌 Serial connection closed")
 
@@ -110,45 +133,49 @@ def advanced_example():
     print("🚀 Advanced motor control example")
     print("This will demonstrate various movement patterns")
 
+    # Bind hot-loop lookups once: methods and the live sensor value view
+    receive = mrf.receive_sensor_data
+    send = mrf.send_motor_command
+    sensor = mrf.sensor_array  # accel x/y/z, gyro x/y/z, encoder 1-4
+
     try:
         sensor_count = 0
         motor_pattern = 0
 
         while True:
             # Read sensor data
-            if mrf.receive_sensor_data():
-                accel_x = mrf.get_accel_x()
-                accel_y = mrf.get_accel_y()
-                accel_z = mrf.get_accel_z()
+            if receive():
+                accel_x = sensor[0]
+                accel_y = sensor[1]
+                accel_z = sensor[2]
 
                 # Display sensor data less frequently to reduce output
                 if sensor_count % 50 == 0:
                     print(f"Sensors: X={accel_x:6d}, Y={accel_y:6d}, Z={accel_z:6d}")
 
-            time.sleep(0.001)
             sensor_count += 1
 
             # Send different motor commands every 100 readings
             if sensor_count > 100:
                 if motor_pattern == 0:
                     # Move forward
-                    mrf.send_motor_command(100, 0)
+                    send(100, 0)
                     print("🎮 Moving forward")
                 elif motor_pattern == 1:
                     # Turn right
-                    mrf.send_motor_command(80, 45)
+                    send(80, 45)
                     print("🎮 Turning right")
                 elif motor_pattern == 2:
                     # Move backward
-                    mrf.send_motor_command(-80, 0)
+                    send(-80, 0)
                     print("🎮 Moving backward")
                 elif motor_pattern == 3:
                     # Turn left
-                    mrf.send_motor_command(80, -45)
+                    send(80, -45)
                     print("🎮 Turning left")
                 elif motor_pattern == 4:
                     # Stop
-                    mrf.send_motor_command(0, 0)
+                    send(0, 0)
                     print("🎮 Stopping")
 
                 motor_pattern = (motor_pattern + 1) % 5
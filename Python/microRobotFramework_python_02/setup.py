@@ -56,7 +56,8 @@ setup(
         'Operating System :: MacOS',
     ],
     python_requires='>=3.7',
-    install_requires=read_requirements(),
+    # The sensor receive path comes from the v1 package (microRobotFramework.MRF)
+    install_requires=read_requirements() + ['microRobotFramework>=1.0.0'],
     extras_require={
         'dev': [
             'pytest>=6.0',
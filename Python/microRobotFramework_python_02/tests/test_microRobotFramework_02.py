@@ -0,0 +1,104 @@
+"""
+Tests for microRobotFramework_02
+Run from the microRobotFramework_python_02 directory:
+    python -m unittest discover -s tests
+"""
+
+import os
+import struct
+import sys
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import microRobotFramework_02 as mrf_module
+
+
+def _packet(values) -> bytes:
+    """Build a 21-byte sensor packet: header 0xF5 + 10 big-endian int16 values"""
+    return b'\xf5' + struct.pack('>10h', *values)
+
+
+@unittest.skipUnless(os.name == 'posix', "needs a pseudo-terminal")
+class PtyTestCase(unittest.TestCase):
+    """Runs an MRF on a pseudo-terminal; bytes written to self.master arrive at the MRF"""
+
+    def setUp(self):
+        import pty
+        import tty
+        self.master, slave = pty.openpty()
+        tty.setraw(self.master)
+        self.mrf = mrf_module.MRF(os.ttyname(slave), 115200)
+        os.close(slave)  # The MRF opened its own descriptor for the port
+        self.assertTrue(self.mrf.is_connected())
+
+    def tearDown(self):
+        self.mrf.close_connection()
+        os.close(self.master)
+
+    def send(self, data: bytes) -> None:
+        os.write(self.master, data)
+        time.sleep(0.02)  # Let the bytes reach the MRF's side of the pty
+
+    def sent(self, size: int) -> bytes:
+        """Read size bytes written by the MRF"""
+        self.mrf.serial_connection.flush()
+        return os.read(self.master, size)
+
+
+class ReceiveTest(PtyTestCase):
+    """The sensor receive path inherited from the version 1 MRF"""
+
+    def test_resyncs_on_the_header(self):
+        self.send(b'\x07' + _packet(range(10)) + _packet(range(-10, 0)))
+
+        self.assertTrue(self.mrf.receive_sensor_data())
+        self.assertEqual(list(self.mrf.sensor_array), list(range(10)))
+        self.assertTrue(self.mrf.receive_sensor_data())
+        self.assertEqual((self.mrf.accel_x, self.mrf.encoder4), (-10, -1))
+
+    def test_drain_and_parse(self):
+        self.send(_packet(range(10)) + b'\x00' + _packet(range(10, 20)))
+
+        self.assertEqual(self.mrf.drain_and_parse(), 2)
+        self.assertEqual(list(self.mrf.sensor_array), list(range(10, 20)))
+
+    def test_parse_sensor_log(self):
+        raw = _packet(range(10)) + b'\x01' + _packet(range(10, 20))
+
+        self.assertEqual(mrf_module.MRF.parse_sensor_log(raw), [tuple(range(10)), tuple(range(10, 20))])
+
+
+class MotorCommandTest(PtyTestCase):
+    """send_motor_command: [0xF5][length 3][speed][angle][checksum]"""
+
+    def test_packet_layout(self):
+        self.assertTrue(self.mrf.send_motor_command(40, -30))
+
+        angle = -30 & 0xFF
+        self.assertEqual(self.sent(5), bytes([0xF5, 3, 40, angle, (0xF5 + 3 + 40 + angle) & 0xFF]))
+
+    def test_clamps_speed_and_angle(self):
+        self.assertTrue(self.mrf.send_motor_command(250, 120, flush=True))
+        self.assertTrue(self.mrf.send_motor_command(-5, -120, flush=True))
+
+        packets = self.sent(10)
+        self.assertEqual(packets[2:4], bytes([100, 90]))
+        self.assertEqual(packets[7:9], bytes([0, -90 & 0xFF]))
+
+    def test_reuses_packets(self):
+        self.mrf.send_motor_command(50, 10)
+        self.mrf.send_motor_command(150, 10)  # Clamped to the same (100, 10) ...
+        self.mrf.send_motor_command(100, 10)  # ... as this one
+        self.sent(15)
+
+        self.assertEqual(set(self.mrf._cmd_cache), {(50, 10), (100, 10)})
+
+    def test_not_connected(self):
+        self.mrf.close_connection()
+
+        self.assertFalse(self.mrf.send_motor_command(50, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
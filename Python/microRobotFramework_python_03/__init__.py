@@ -17,7 +17,7 @@ Version 03 Features:
 - Advanced control patterns and sequences
 """
 
-from .microRobotFramework_03 import MRF, MRFThreadManager
+from .microRobotFramework_03 import MRF, MRFThreadManager, attach_shared_sensors
 
 __version__ = "3.0.0"
 __author__ = "JD-edu"
@@ -28,6 +28,7 @@ __description__ = "Python version of microRobotFramework Version 03 with multi-t
 __all__ = [
     'MRF',
     'MRFThreadManager',
+    'attach_shared_sensors',
 ]
 
 # Version info
@@ -6,14 +6,19 @@ Converted from microRobotFramework.hpp and microRobotFramework.cpp
 Version 03 Features:
 - Multi-threading support for concurrent sensor reading and motor control
 - Speed and angle based motor control system
-- Enhanced serial communication with mutex protection
+- Enhanced serial communication: single lock-free reader, locked writers
 - Real-time sensor data processing
 """
 
+import contextlib
+import numpy as np
+import os
+import select
 import serial
-import struct
+import sys
 import time
 import threading
+from collections import deque
 from typing import Optional, Tuple
 import logging
 
@@ -21,6 +26,29 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Precompiled big-endian wire dtypes, so parsing doesn't re-parse dtype strings per frame
+_IMU_DTYPE = np.dtype('>i2')  # IMU values: signed 16-bit
+_ENC_DTYPE = np.dtype('>u2')  # Encoder values: unsigned 16-bit
+
+SHARED_SENSORS_SIZE = 10 * 4  # Shared memory layout: 10 int32 values (see attach_shared_sensors)
+
+
+def _fill_motor_packet(packet: bytearray, speed: int, angle: int) -> None:
+    """
+    Fill a motor command packet in place: [Header (0xAA)][Length (3)][Speed][Angle][XOR checksum]
+    Only the speed, angle and checksum bytes are written; header and length are set once
+
+    Args:
+        packet (bytearray): 5-byte packet buffer starting with 0xAA, 3
+        speed (int): Motor speed, already clamped to 0-255
+        angle (int): Steering angle, already clamped to -127 to 127
+    """
+    speed &= 0xFF  # Speed byte
+    angle &= 0xFF  # Angle byte (handle negative values)
+    packet[2] = speed
+    packet[3] = angle
+    packet[4] = 0xAA ^ 3 ^ speed ^ angle  # XOR checksum
+
 
 class MRF:
     """
@@ -31,44 +59,77 @@ class MRF:
     # Constants
     HEADER_BYTE = 0xF5  # Header byte for sensor data reception
     MOTOR_HEADER = 0xAA  # Header byte for motor commands
+    FRAME_SIZE = 21  # Header + 20 data bytes, as sent by mpu6050_get_raw_data_03.ino
+    RX_BUFFER_SIZE = 1024  # Receive buffer capacity (about 48 frames)
+
+    HISTORY_SIZE = 256  # Number of frames kept in the sensor history ring buffer
 
-    def __init__(self, port: str, baud_rate: int):
+    def __init__(self, port: str, baud_rate: int, shared_memory_name: Optional[str] = None,
+                 thread_safe: bool = True):
         """
         Constructor
 
         Args:
             port (str): Serial port path (e.g., '/dev/ttyUSB0', 'COM3')
             baud_rate (int): Baud rate for serial communication (e.g., 115200)
+            shared_memory_name (str, optional): Also publish every frame to a shared memory block
+                with this name, so other processes can read the sensor values without going
+                through this object (see attach_shared_sensors). Default: disabled
+            thread_safe (bool): Serialize motor commands with a lock (default: True). Pass False
+                when only one thread sends commands to skip the lock on every send
         """
         self.serial_port = port
         self.baud_rate = baud_rate
         self.connected = False
         self.serial_connection: Optional[serial.Serial] = None
+        self._io: Optional[serial.Serial] = None  # Open port used on the hot path, None when disconnected
+        self._fd: Optional[int] = None  # Raw file descriptor of the port (POSIX only)
+        # Fixed receive buffer: bytes not yet parsed are kept at the front across calls
+        self._rx_buffer = bytearray(self.RX_BUFFER_SIZE)
+        self._rx_view = memoryview(self._rx_buffer)
+        self._rx_length = 0
+        # Fixed frame payload buffer (sensor values) with typed views over it,
+        # built once so parsing a frame creates no new arrays
+        self._frame_buf = bytearray(self.FRAME_SIZE - 1)
+        self._frame_imu = np.frombuffer(self._frame_buf, dtype=_IMU_DTYPE, count=6)
+        self._frame_enc = np.frombuffer(self._frame_buf, dtype=_ENC_DTYPE, count=4, offset=12)
+        self._motor_packet = bytearray((self.MOTOR_HEADER, 3, 0, 0, 0))  # Reused for every motor command
 
         # Thread synchronization
-        self.serial_mutex = threading.Lock()
+        # Only writes are locked: several threads may send motor commands, while sensor
+        # data has a single reader (see receive_sensor_data), so reads need no lock.
+        # pyserial can read and write the same port from two threads at once
+        self.write_mutex = threading.Lock() if thread_safe else contextlib.nullcontext()
         self.running = threading.Event()
         self.running.set()  # Initially running
+        # Set after every received frame, so consumers can wait for data instead of polling;
+        # the consumer clears it once it has woken up
+        self.new_data_event = threading.Event()
 
-        # IMU Data
-        self.accel_x = 0
-        self.accel_y = 0
-        self.accel_z = 0
-        self.gyro_x = 0
-        self.gyro_y = 0
-        self.gyro_z = 0
+        # IMU Data: accel x/y/z, gyro x/y/z (updated in place by every frame)
+        self._imu = np.zeros(6, dtype=np.int16)
         self.pitch = 0.0
         self.roll = 0.0
         self.yaw = 0.0
 
-        # Encoder Data
-        self.encoder1 = 0
-        self.encoder2 = 0
-        self.encoder3 = 0
-        self.encoder4 = 0
+        # Encoder Data: encoder 1-4 (updated in place by every frame)
+        self._enc = np.zeros(4, dtype=np.uint16)
+
+        # Ring buffer of recent frames, one row per frame: accel x/y/z, gyro x/y/z, encoder 1-4
+        self._history = np.zeros((self.HISTORY_SIZE, 10), dtype=np.int32)
+        self._history_index = 0
+        self._history_count = 0
+
+        # Optional shared memory copy of the latest frame (same layout as a history row)
+        self._shm = None
+        self._shared_sensors: Optional[np.ndarray] = None
+        if shared_memory_name:
+            self._create_shared_sensors(shared_memory_name)
 
         # Initialize serial connection
         self.connected = self._open_serial()
+        if self.connected:
+            self._io = self.serial_connection
 
     def _open_serial(self) -> bool:
         """
@@ -81,17 +142,62 @@ class MRF:
             self.serial_connection = serial.Serial(
                 port=self.serial_port,
                 baudrate=self.baud_rate,
-                timeout=0.1,  # 100ms timeout
+                timeout=0.1,  # 100ms timeout: read() blocks until a full frame arrives
+                inter_byte_timeout=None,  # Don't return partial frames between bytes
                 bytesize=serial.EIGHTBITS,
                 parity=serial.PARITY_NONE,
                 stopbits=serial.STOPBITS_ONE
             )
             logger.info(f"Serial connection opened: {self.serial_port}")
+
+            # Deliver received bytes immediately instead of after the driver's
+            # latency timer (16ms by default on Linux USB-serial adapters)
+            try:
+                self.serial_connection.set_low_latency_mode(True)
+            except (AttributeError, ValueError, OSError) as e:
+                logger.debug(f"Low latency mode not available: {e}")
+
+            # Raw descriptor for direct os.read/os.write; pyserial's read/write are used without it
+            try:
+                self._fd = self.serial_connection.fileno()
+            except (AttributeError, ValueError, OSError):
+                self._fd = None
+
             return True
         except (serial.SerialException, OSError) as e:
             logger.error(f"Error opening serial port {self.serial_port}: {e}")
             return False
 
+    def _create_shared_sensors(self, name: str) -> None:
+        """
+        Create the shared memory block that mirrors the latest frame
+
+        Args:
+            name (str): Shared memory block name
+        """
+        from multiprocessing import shared_memory  # Only needed when sharing is enabled
+
+        try:
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=SHARED_SENSORS_SIZE)
+        except (FileExistsError, OSError) as e:
+            logger.error(f"Error creating shared memory {name}: {e}")
+            return
+        self._shared_sensors = np.ndarray((10,), dtype=np.int32, buffer=self._shm.buf)
+        self._shared_sensors[:] = 0
+        logger.info(f"Sensor data shared as: {name}")
+
+    def _release_shared_sensors(self) -> None:
+        """Close and remove the shared memory block, if any"""
+        if self._shm is None:
+            return
+        self._shared_sensors = None  # Drop the view before closing the buffer
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+        self._shm = None
+
     def is_connected(self) -> bool:
         """
         Check if serial connection is active
@@ -101,57 +207,186 @@ class MRF:
         """
         return self.connected and self.serial_connection is not None and self.serial_connection.is_open
 
+    def _drop_connection(self) -> None:
+        """
+        Stop using the port after a read/write error
+        pyserial keeps is_open True after errors such as EIO on an unplugged device, so the
+        cached handles are dropped here; later calls fail fast until close_connection()
+        """
+        self._io = None
+        self._fd = None
+        self.connected = False
+
     def receive_sensor_data(self) -> bool:
         """
-        Receive sensor data from serial port (23 bytes total)
-        Data format: [Header][Length][IMU Data (12 bytes)][Encoder Data (8 bytes)][Checksum]
+        Receive sensor data from serial port (21 bytes per frame)
+        Data format: [Header (0xF5)][IMU Data (12 bytes)][Encoder Data (8 bytes)]
+        A frame is only parsed once the next frame's header byte follows it, so bytes before a
+        header and a 0xF5 inside the data are skipped instead of misaligning the stream, and a
+        lost byte only costs the frame it belonged to. The newest frame is therefore returned
+        when the next one starts to arrive.
+        Everything already waiting in the OS buffer is read at once and all complete frames
+        are parsed (each one goes into the history), leaving the latest in the getters.
+        Call from one thread only (e.g. MRFThreadManager's sensor thread); reads are not locked
 
         Returns:
             bool: True if data received successfully, False otherwise
         """
-        if not self.is_connected():
+        io = self._io
+        if io is None:
             return False
 
         try:
-            with self.serial_mutex:  # Thread-safe serial access
-                # Read 23 bytes as per C++ implementation
-                data_buffer = self.serial_connection.read(23)
-                if len(data_buffer) != 23:
+            buffer = self._rx_buffer
+            view = self._rx_view
+            length = self._rx_length
+            header = self.HEADER_BYTE
+            frame_size = self.FRAME_SIZE
+            timed_out = False
+            while True:
+                # Parse every complete frame in the buffer; the getters end up on the latest one
+                parsed = False
+                position = 0
+                while True:
+                    # Resync: skip everything before the next header byte
+                    start = buffer.find(header, position, length)
+                    if start < 0:
+                        position = length
+                        break
+                    end = start + frame_size
+                    # A 0xF5 inside the data looks like a header too: only trust one that the
+                    # next frame's header follows, so the frame is complete and aligned
+                    if length <= end:
+                        position = start
+                        break
+                    if buffer[end] != header:
+                        position = start + 1
+                        continue
+
+                    # Parse the data (skip the header byte) straight from the buffer
+                    self._parse_sensor_data(view[start + 1:end])
+                    position = end
+                    parsed = True
+
+                # Move the unparsed tail to the front for the next call
+                if position:
+                    view[:length - position] = view[position:length]
+                    length -= position
+                    self._rx_length = length
+                if parsed:
+                    self.new_data_event.set()
+                    return True
+
+                if timed_out:
                     return False
 
-                # Parse the data (skip header and length bytes)
-                self._parse_sensor_data(data_buffer[2:])  # Skip first 2 bytes
-                return True
+                # Read whatever has arrived, or block for the rest of the frame and the first
+                # byte of the next one
+                wanted = min(io.in_waiting or frame_size + 1 - length, self.RX_BUFFER_SIZE - length)
+                count = self._read_into(io, view[length:length + wanted])
+                length += count
+                self._rx_length = length
+                timed_out = count < wanted
 
         except (serial.SerialException, OSError) as e:
             logger.error(f"Error reading sensor data: {e}")
+            self._drop_connection()
             return False
 
-    def _parse_sensor_data(self, data_buffer: bytes) -> None:
+    def _read_into(self, io: serial.Serial, view: memoryview) -> int:
+        """
+        Read into view, blocking until it is full or the port timeout expires
+        Uses os.readv on the raw file descriptor when available, bypassing pyserial's read loop
+
+        Args:
+            io (serial.Serial): Open port (the caller's cached handle)
+            view (memoryview): Writable target buffer
+
+        Returns:
+            int: Number of bytes read (less than len(view) on timeout)
+        """
+        fd = self._fd
+        if fd is None:
+            return io.readinto(view)
+
+        size = len(view)
+        received = 0
+        deadline = None
+        readable = False  # select() reported data that the last read hasn't returned yet
+        while received < size:
+            try:
+                count = os.readv(fd, (view[received:],))
+            except BlockingIOError:
+                count = 0  # Port is non-blocking and nothing has arrived yet
+
+            if count:
+                received += count
+                readable = False
+                continue
+            if readable:
+                # Readable but empty: the device was disconnected
+                raise serial.SerialException("device reports readiness to read but returned no data")
+
+            # Wait for more data until the port timeout expires
+            if deadline is None:
+                deadline = time.monotonic() + io.timeout
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select((fd,), (), (), remaining)[0]:
+                break
+            readable = True
+        return received
+
+    def _write(self, io: serial.Serial, data: bytes) -> int:
         """
-        Parse sensor data from buffer (21 bytes of actual data)
-        Data format: 6 int16 values (IMU) + 4 uint16 values (Encoders) + checksum
+        Write data to the serial port
+        Uses os.write on the raw file descriptor when available, bypassing pyserial's write loop
 
         Args:
-            data_buffer (bytes): 21-byte data buffer
+            io (serial.Serial): Open port (the caller's cached handle)
+            data (bytes): Data to send
+
+        Returns:
+            int: Number of bytes written
         """
+        fd = self._fd
+        if fd is None:
+            return io.write(data)
+
         try:
-            # Parse IMU data (12 bytes) - big-endian format as per C++ code
-            self.accel_x = struct.unpack('>h', data_buffer[0:2])[0]
-            self.accel_y = struct.unpack('>h', data_buffer[2:4])[0]
-            self.accel_z = struct.unpack('>h', data_buffer[4:6])[0]
-            self.gyro_x = struct.unpack('>h', data_buffer[6:8])[0]
-            self.gyro_y = struct.unpack('>h', data_buffer[8:10])[0]
-            self.gyro_z = struct.unpack('>h', data_buffer[10:12])[0]
-
-            # Parse Encoder data (8 bytes) - big-endian format
-            self.encoder1 = struct.unpack('>H', data_buffer[12:14])[0]
-            self.encoder2 = struct.unpack('>H', data_buffer[14:16])[0]
-            self.encoder3 = struct.unpack('>H', data_buffer[16:18])[0]
-            self.encoder4 = struct.unpack('>H', data_buffer[18:20])[0]
-
-        except struct.error as e:
-            logger.error(f"Error parsing sensor data: {e}")
+            written = os.write(fd, data)
+        except BlockingIOError:
+            written = 0
+        if written < len(data):
+            written += io.write(data[written:])  # Output buffer full: let pyserial wait
+        return written
+
+    def _parse_sensor_data(self, data_buffer: memoryview) -> None:
+        """
+        Parse sensor data from buffer (20 bytes of actual data)
+        Data format: 6 int16 values (IMU) + 4 uint16 values (Encoders)
+
+        Args:
+            data_buffer (memoryview): 20-byte data buffer; receive_sensor_data() only passes
+                whole frames (the frame buffer has views over it and can't change size)
+        """
+        # Parse IMU data (12 bytes) and Encoder data (8 bytes) - big-endian format as per C++ code
+        # Copy the payload into the fixed frame buffer; its views then hold the decoded values
+        self._frame_buf[:] = data_buffer
+        imu = self._frame_imu
+        enc = self._frame_enc
+        self._imu[:] = imu
+        self._enc[:] = enc
+
+        # Append to the history ring buffer
+        row = self._history[self._history_index]
+        row[:6] = imu
+        row[6:] = enc
+        shared = self._shared_sensors
+        if shared is not None:
+            shared[:] = row
+        self._history_index = (self._history_index + 1) % self.HISTORY_SIZE
+        if self._history_count < self.HISTORY_SIZE:
+            self._history_count += 1
 
     def send_motor_command(self, speed: int, angle: int) -> bool:
         """
@@ -165,77 +400,145 @@ class MRF:
         Returns:
             bool: True if command sent successfully, False otherwise
         """
-        if not self.is_connected():
+        io = self._io
+        if io is None:
             logger.error("Serial port not connected!")
             return False
 
         try:
-            with self.serial_mutex:  # Thread-safe serial access
-                # Validate input ranges
-                speed = max(0, min(255, speed))  # Clamp to 0-255
-                angle = max(-127, min(127, angle))  # Clamp to -127 to 127
-
-                # Create packet as per C++ implementation
-                packet = bytearray(5)
-                packet[0] = self.MOTOR_HEADER  # Header byte (0xAA)
-                packet[1] = 3  # Length byte (speed + angle + checksum)
-                packet[2] = speed & 0xFF  # Speed byte
-                packet[3] = angle & 0xFF  # Angle byte (handle negative values)
-                packet[4] = packet[0] ^ packet[1] ^ packet[2] ^ packet[3]  # XOR checksum
-
-                # Send packet
-                bytes_written = self.serial_connection.write(packet)
-                if bytes_written != len(packet):
-                    logger.error("Failed to send complete motor command!")
-                    return False
+            # Validate input ranges
+            speed = 0 if speed < 0 else (255 if speed > 255 else speed)  # Clamp to 0-255
+            angle = -127 if angle < -127 else (127 if angle > 127 else angle)  # Clamp to -127 to 127
+
+            # Fill the shared packet as per C++ implementation and send it
+            packet = self._motor_packet
+            with self.write_mutex:  # One writer at a time (also guards the shared packet)
+                _fill_motor_packet(packet, speed, angle)
+                bytes_written = self._write(io, packet)
+            if bytes_written != len(packet):
+                logger.error("Failed to send complete motor command!")
+                return False
 
-                return True
+            return True
 
         except (serial.SerialException, OSError) as e:
             logger.error(f"Error sending motor command: {e}")
+            self._drop_connection()
             return False
 
     # Getter methods for IMU data
     def get_accel_x(self) -> int:
         """Get X-axis acceleration"""
-        return self.accel_x
+        return int(self._imu[0])
 
     def get_accel_y(self) -> int:
         """Get Y-axis acceleration"""
-        return self.accel_y
+        return int(self._imu[1])
 
     def get_accel_z(self) -> int:
         """Get Z-axis acceleration"""
-        return self.accel_z
+        return int(self._imu[2])
 
     def get_gyro_x(self) -> int:
         """Get X-axis gyroscope data"""
-        return self.gyro_x
+        return int(self._imu[3])
 
     def get_gyro_y(self) -> int:
         """Get Y-axis gyroscope data"""
-        return self.gyro_y
+        return int(self._imu[4])
 
     def get_gyro_z(self) -> int:
         """Get Z-axis gyroscope data"""
-        return self.gyro_z
+        return int(self._imu[5])
 
     # Getter methods for Encoder data
     def get_encoder1(self) -> int:
         """Get encoder 1 value"""
-        return self.encoder1
+        return int(self._enc[0])
 
     def get_encoder2(self) -> int:
         """Get encoder 2 value"""
-        return self.encoder2
+        return int(self._enc[1])
 
     def get_encoder3(self) -> int:
         """Get encoder 3 value"""
-        return self.encoder3
+        return int(self._enc[2])
 
     def get_encoder4(self) -> int:
         """Get encoder 4 value"""
-        return self.encoder4
+        return int(self._enc[3])
+
+    # IMU data (read-only, same values as the getters)
+    @property
+    def accel_x(self) -> int:
+        """X-axis acceleration"""
+        return int(self._imu[0])
+
+    @property
+    def accel_y(self) -> int:
+        """Y-axis acceleration"""
+        return int(self._imu[1])
+
+    @property
+    def accel_z(self) -> int:
+        """Z-axis acceleration"""
+        return int(self._imu[2])
+
+    @property
+    def gyro_x(self) -> int:
+        """X-axis gyroscope data"""
+        return int(self._imu[3])
+
+    @property
+    def gyro_y(self) -> int:
+        """Y-axis gyroscope data"""
+        return int(self._imu[4])
+
+    @property
+    def gyro_z(self) -> int:
+        """Z-axis gyroscope data"""
+        return int(self._imu[5])
+
+    # Encoder data (read-only, same values as the getters)
+    @property
+    def encoder1(self) -> int:
+        """Encoder 1 value"""
+        return int(self._enc[0])
+
+    @property
+    def encoder2(self) -> int:
+        """Encoder 2 value"""
+        return int(self._enc[1])
+
+    @property
+    def encoder3(self) -> int:
+        """Encoder 3 value"""
+        return int(self._enc[2])
+
+    @property
+    def encoder4(self) -> int:
+        """Encoder 4 value"""
+        return int(self._enc[3])
+
+    def get_imu_snapshot(self) -> Tuple[int, int, int, int, int, int]:
+        """
+        Get all six IMU values from the same frame in one call
+
+        Returns:
+            Tuple[int, int, int, int, int, int]: (accel x, accel y, accel z, gyro x, gyro y, gyro z)
+        """
+        return tuple(self._imu.tolist())
+
+    def get_sensor_history(self) -> np.ndarray:
+        """
+        Get recently received frames, oldest first
+
+        Returns:
+            np.ndarray: (n, 10) int32 array, one row per frame: accel x/y/z, gyro x/y/z, encoder 1-4
+        """
+        if self._history_count < self.HISTORY_SIZE:
+            return self._history[:self._history_count].copy()
+        return np.roll(self._history, -self._history_index, axis=0)
 
     def stop_threads(self) -> None:
         """Stop all running threads"""
@@ -244,16 +547,46 @@ class MRF:
     def close_connection(self) -> None:
         """Close serial connection and stop threads"""
         self.stop_threads()
+        self._io = None
+        self._fd = None
         if self.serial_connection and self.serial_connection.is_open:
             self.serial_connection.close()
             logger.info("Serial connection closed")
         self.connected = False
+        self._release_shared_sensors()
 
     def __del__(self):
         """Destructor - ensure serial connection is closed"""
         self.close_connection()
 
 
+def attach_shared_sensors(name: str) -> Tuple["shared_memory.SharedMemory", np.ndarray]:
+    """
+    Attach to the sensor data published by MRF(..., shared_memory_name=name)
+    The array is updated in place by the MRF process; copy it for a consistent snapshot.
+    Close the returned block when done (don't unlink it, the MRF process owns it)
+
+    Args:
+        name (str): Shared memory block name
+
+    Returns:
+        Tuple[SharedMemory, np.ndarray]: Block handle and a (10,) int32 view:
+            accel x/y/z, gyro x/y/z, encoder 1-4
+    """
+    from multiprocessing import shared_memory
+
+    if sys.version_info >= (3, 13):
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    else:
+        shm = shared_memory.SharedMemory(name=name)
+        if os.name == 'posix':
+            # Older Pythons track attached blocks too and would unlink the block at exit;
+            # the tracker knows POSIX blocks by their "/"-prefixed name
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister('/' + shm.name, 'shared_memory')
+    return shm, np.ndarray((10,), dtype=np.int32, buffer=shm.buf)
+
+
 # Thread-safe functions for multi-threading support
 class MRFThreadManager:
     """
@@ -261,25 +594,66 @@ class MRFThreadManager:
     Handles concurrent sensor reading and motor control
     """
 
+    # Sensor thread retry delays after failed reads that didn't block (seconds)
+    MIN_RETRY_DELAY = 0.001
+    MAX_RETRY_DELAY = 1.0
+    # A failed read faster than this never waited for data: the port is broken or closed.
+    # A plain timeout already blocks for the port timeout (100ms) and needs no extra delay
+    FAST_FAILURE_TIME = 0.01
+
+    IMU_QUEUE_SIZE = 64  # IMU samples kept for consumers; the oldest are dropped first
+
     def __init__(self, mrf_instance: MRF):
         self.mrf = mrf_instance
         self.sensor_thread = None
         self.motor_thread = None
+        # Sensor thread -> consumer hand-off of (accel x/y/z, gyro x/y/z) tuples.
+        # One producer and bounded appends/pops on a deque are atomic, so no lock is needed
+        self.imu_queue = deque(maxlen=self.IMU_QUEUE_SIZE)
 
-    def start_sensor_thread(self, read_interval: float = 0.05):
+    def start_sensor_thread(self, min_interval: float = 0.0):
         """
         Start sensor data reading thread
+        Reads frames as fast as they arrive: receive_sensor_data() blocks until the next one
 
         Args:
-            read_interval (float): Reading interval in seconds (default: 50ms)
+            min_interval (float): Optional rate limit, minimum time between reads in seconds
+                (default: 0, no limit). Only the part not already spent reading is slept
         """
         def sensor_reader():
-            while self.mrf.running.is_set():
-                if self.mrf.receive_sensor_data():
-                    logger.debug(f"Sensor data: AccelX={self.mrf.get_accel_x()}, "
-                               f"AccelY={self.mrf.get_accel_y()}, "
-                               f"AccelZ={self.mrf.get_accel_z()}")
-                time.sleep(read_interval)
+            # Bind hot-loop methods once instead of looking them up every iteration
+            mrf = self.mrf
+            is_running = mrf.running.is_set
+            receive = mrf.receive_sensor_data
+            snapshot = mrf.get_imu_snapshot
+            push = self.imu_queue.append
+            sleep = time.sleep
+            monotonic = time.monotonic
+            last_read = monotonic()
+            backoff = self.MIN_RETRY_DELAY
+            fast_failure_time = self.FAST_FAILURE_TIME
+
+            while is_running():
+                if min_interval:
+                    remaining = min_interval - (monotonic() - last_read)
+                    if remaining > 0:
+                        sleep(remaining)
+                    last_read = monotonic()
+
+                started = monotonic()
+                if receive():
+                    backoff = self.MIN_RETRY_DELAY
+                    sample = snapshot()
+                    push(sample)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Sensor data: AccelX={sample[0]}, "
+                                   f"AccelY={sample[1]}, "
+                                   f"AccelZ={sample[2]}")
+                elif monotonic() - started < fast_failure_time or not mrf.is_connected():
+                    # Reads fail instantly (port gone or erroring): back off instead of spinning,
+                    # whether or not the error was noticed as a disconnect
+                    sleep(backoff)
+                    backoff = min(backoff * 2, self.MAX_RETRY_DELAY)
 
         self.sensor_thread = threading.Thread(target=sensor_reader, daemon=True)
         self.sensor_thread.start()
@@ -296,9 +670,14 @@ class MRFThreadManager:
             command_interval (float): Command sending interval in seconds (default: 100ms)
         """
         def motor_commander():
-            while self.mrf.running.is_set():
-                self.mrf.send_motor_command(speed, angle)
-                time.sleep(command_interval)
+            # Bind hot-loop methods once instead of looking them up every iteration
+            is_running = self.mrf.running.is_set
+            send = self.mrf.send_motor_command
+            sleep = time.sleep
+
+            while is_running():
+                send(speed, angle)
+                sleep(command_interval)
 
         self.motor_thread = threading.Thread(target=motor_commander, daemon=True)
         self.motor_thread.start()
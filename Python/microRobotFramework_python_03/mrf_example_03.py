@@ -15,12 +15,20 @@ Usage:
     python3 mrf_example_03.py
 """
 
+import sched
+import selectors
 import time
 import sys
 import threading
 import signal
 from microRobotFramework_03 import MRF, MRFThreadManager
 
+# Preformatted display line: accel x/y/z, gyro x/y/z
+_IMU_FMT = '    '.join(['{:6d}'] * 6).format
+
+PATTERN_COMMAND_INTERVAL = 0.1  # Seconds between motor commands in _run_motor_patterns()
+PATTERN_DISPLAY_INTERVAL = 0.2  # Seconds between accel lines in _run_motor_patterns()
+
 
 class MRFExample03:
     """
@@ -37,16 +45,16 @@ class MRFExample03:
         """
         self.mrf = MRF(port, baud_rate)
         self.thread_manager = MRFThreadManager(self.mrf)
-        self.running = True
+        self.running = threading.Event()
+        self.running.set()  # Cleared by Ctrl+C; shared with the display and pattern loops
 
         # Setup signal handler for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
 
     def _signal_handler(self, signum, frame):
         """Handle Ctrl+C signal for graceful shutdown"""
-        print("
-🛑 Received interrupt signal. Shutting down gracefully...")
-        self.running = False
+        print("\n🛑 Received interrupt signal. Shutting down gracefully...")
+        self.running.clear()
 
     def run_basic_example(self):
         """
@@ -67,14 +75,14 @@ class MRFExample03:
 
         print("✅ Serial connection established!")
         print("🧵 Starting multi-threading operations...")
-        print("📡 Sensor data reading thread: 50ms interval")
+        print("📡 Sensor data reading thread: reads frames as they arrive")
         print("🎮 Motor command thread: 100ms interval")
         print("Press ENTER to stop or Ctrl+C for immediate shutdown")
         print("-" * 60)
 
         try:
-            # Start sensor reading thread (50ms interval)
-            self.thread_manager.start_sensor_thread(read_interval=0.05)
+            # Start sensor reading thread (no fixed interval, it waits for each frame)
+            self.thread_manager.start_sensor_thread()
 
             # Start motor command thread (speed=90, angle=100, 100ms interval)
             self.thread_manager.start_motor_thread(
@@ -87,8 +95,7 @@ class MRFExample03:
             self._display_sensor_data()
 
         except KeyboardInterrupt:
-            print("
-🛑 Program interrupted by user")
+            print("\n🛑 Program interrupted by user")
         except Exception as e:
             print(f"❌ Error occurred: {e}")
             return 1
@@ -103,45 +110,51 @@ class MRFExample03:
         """
         last_display_time = time.time()
         display_interval = 0.2  # Display every 200ms
+        imu_queue = self.thread_manager.imu_queue  # Filled by the sensor thread
+        new_data = self.mrf.new_data_event
 
         print("📊 Real-time Sensor Data (Press ENTER to stop):")
         print("AccelX    AccelY    AccelZ    GyroX     GyroY     GyroZ")
         print("-" * 60)
 
-        # Non-blocking input setup
-        import select
-        import sys
-
-        while self.running and self.mrf.running.is_set():
-            current_time = time.time()
+        # Non-blocking input setup: register stdin once (epoll/kqueue where available)
+        # Where stdin can't be selected on (e.g. Windows), only Ctrl+C stops the loop
+        selector = selectors.DefaultSelector()
+        try:
+            selector.register(sys.stdin, selectors.EVENT_READ)
+            stdin_ready = selector.select
+        except (ValueError, OSError):
+            stdin_ready = None
 
-            # Display sensor data at specified interval
-            if current_time - last_display_time >= display_interval:
-                accel_x = self.mrf.get_accel_x()
-                accel_y = self.mrf.get_accel_y()
-                accel_z = self.mrf.get_accel_z()
-                gyro_x = self.mrf.get_gyro_x()
-                gyro_y = self.mrf.get_gyro_y()
-                gyro_z = self.mrf.get_gyro_z()
+        try:
+            while self.running.is_set() and self.mrf.running.is_set():
+                # Sleep until the sensor thread receives a frame (or the interval passes with none)
+                if new_data.wait(display_interval):
+                    new_data.clear()
+                current_time = time.time()
 
-                print(f"{accel_x:6d}    {accel_y:6d}    {accel_z:6d}    "
-                      f"{gyro_x:6d}    {gyro_y:6d}    {gyro_z:6d}")
+                # Display sensor data at specified interval
+                if current_time - last_display_time >= display_interval and imu_queue:
+                    # Show the newest sample and drop the ones that arrived in between
+                    sample = imu_queue.pop()
+                    imu_queue.clear()
 
-                last_display_time = current_time
+                    print(_IMU_FMT(*sample))
 
-            # Check for user input (non-blocking on Unix systems)
-            if sys.stdin in select.select([sys.stdin], [], [], 0)[0]:
-                input()  # Consume the input
-                break
+                    last_display_time = current_time
 
-            time.sleep(0.01)  # Small sleep to prevent busy waiting
+                # Check for user input (non-blocking)
+                if stdin_ready is not None and stdin_ready(0):
+                    input()  # Consume the input
+                    break
+        finally:
+            selector.close()
 
     def _cleanup(self):
         """
         Clean up resources and stop threads
         """
-        print("
-🧹 Cleaning up...")
+        print("\n🧹 Cleaning up...")
 
         # Stop all threads
         self.thread_manager.stop_all_threads()
@@ -170,14 +183,13 @@ class MRFExample03:
 
         try:
             # Start sensor reading thread
-            self.thread_manager.start_sensor_thread(read_interval=0.05)
+            self.thread_manager.start_sensor_thread()
 
             # Run motor control patterns
             self._run_motor_patterns()
 
         except KeyboardInterrupt:
-            print("
-🛑 Program interrupted by user")
+            print("\n🛑 Program interrupted by user")
         except Exception as e:
             print(f"❌ Error occurred: {e}")
             return 1
@@ -198,29 +210,45 @@ class MRFExample03:
             {"name": "Stop", "speed": 0, "angle": 0, "duration": 1},
         ]
 
+        # Motor commands and sensor display run as independent periodic ticks on one
+        # scheduler, so printing never delays the next command
+        scheduler = sched.scheduler(time.monotonic, time.sleep)
+        send = self.mrf.send_motor_command
+        snapshot = self.mrf.get_imu_snapshot
+
+        def schedule_every(interval, start, end, priority, action, *args):
+            """Run action(*args) at start and every interval after it, until end or shutdown"""
+            def tick(count):
+                if not self.running.is_set() or not self.mrf.running.is_set():
+                    for event in scheduler.queue:  # Shutting down: drop everything still pending
+                        scheduler.cancel(event)
+                    return
+                action(*args)
+                due = start + count * interval  # Fixed schedule: a slow tick doesn't shift the later ones
+                if due < end:
+                    scheduler.enterabs(due, priority, tick, (count + 1,))
+            scheduler.enterabs(start, priority, tick, (1,))
+
+        def display_accel():
+            accel_x, accel_y, accel_z = snapshot()[:3]
+            print(f"  📊 Accel: X={accel_x:6d}, Y={accel_y:6d}, Z={accel_z:6d}")
+
         for pattern in patterns:
-            if not self.running or not self.mrf.running.is_set():
+            if not self.running.is_set() or not self.mrf.running.is_set():
                 break
 
             print(f"🎮 Pattern: {pattern['name']} "
                   f"(Speed={pattern['speed']}, Angle={pattern['angle']}) "
                   f"for {pattern['duration']}s")
 
-            # Send motor commands for the pattern duration
-            start_time = time.time()
-            while (time.time() - start_time) < pattern['duration']:
-                if not self.running or not self.mrf.running.is_set():
-                    break
-
-                self.mrf.send_motor_command(pattern['speed'], pattern['angle'])
-
-                # Display sensor data
-                accel_x = self.mrf.get_accel_x()
-                accel_y = self.mrf.get_accel_y()
-                accel_z = self.mrf.get_accel_z()
-                print(f"  📊 Accel: X={accel_x:6d}, Y={accel_y:6d}, Z={accel_z:6d}")
-
-                time.sleep(0.1)  # 100ms interval
+            # Send motor commands and display sensor data for the pattern duration
+            start_time = time.monotonic()
+            end_time = start_time + pattern['duration']
+            schedule_every(PATTERN_COMMAND_INTERVAL, start_time, end_time, 0,
+                           send, pattern['speed'], pattern['angle'])
+            schedule_every(PATTERN_DISPLAY_INTERVAL, start_time, end_time, 1, display_accel)
+            scheduler.enterabs(end_time, 2, lambda: None)  # Hold the pattern for its full duration
+            scheduler.run()
 
         print("🏁 Motor pattern sequence completed")
 
@@ -237,8 +265,7 @@ def main():
     example = MRFExample03("/dev/ttyUSB0", 115200)
 
     # Choose example type
-    print("
-Select example type:")
+    print("\nSelect example type:")
     print("1. Basic multi-threading example (default)")
     print("2. Advanced motor control patterns")
 
@@ -253,8 +280,7 @@ Select example type:")
         return exit_code
 
     except KeyboardInterrupt:
-        print("
-🛑 Program interrupted during setup")
+        print("\n🛑 Program interrupted during setup")
         return 1
     except Exception as e:
         print(f"❌ Setup error: {e}")
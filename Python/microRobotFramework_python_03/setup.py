@@ -20,7 +20,7 @@ def read_requirements():
     if os.path.exists(requirements_path):
         with open(requirements_path, 'r', encoding='utf-8') as f:
             return [line.strip() for line in f if line.strip() and not line.startswith('#')]
-    return ['pyserial>=3.5']
+    return ['pyserial>=3.5', 'numpy>=1.19.0']
 
 setup(
     name='microRobotFramework-03',
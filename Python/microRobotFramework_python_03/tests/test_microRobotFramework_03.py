@@ -0,0 +1,208 @@
+"""
+Tests for microRobotFramework_03
+Run from the microRobotFramework_python_03 directory:
+    python -m unittest discover -s tests
+"""
+
+import logging
+import os
+import struct
+import subprocess
+import sys
+import threading
+import unittest
+import uuid
+from multiprocessing import shared_memory
+
+import numpy as np
+import serial
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import microRobotFramework_03 as mrf_module
+
+
+def _frame(values) -> bytes:
+    """
+    Build a sensor frame the way mpu6050_get_raw_data_03.ino sends it (21 bytes):
+    data[0] = 0xF5, data[1..20] = 6 int16 IMU + 4 uint16 encoder values, high byte first
+    """
+    return b'\xf5' + struct.pack('>6h4H', *values)
+
+
+def _loop_serial(**kwargs) -> serial.Serial:
+    """Stand-in for serial.Serial: a loopback port that reads back what is written"""
+    return serial.serial_for_url('loop://', timeout=kwargs.get('timeout', 0.1))
+
+
+class SharedSensorsTest(unittest.TestCase):
+    """Sensor values published through shared memory (attach_shared_sensors)"""
+
+    def setUp(self):
+        self._serial = mrf_module.serial.Serial
+        mrf_module.serial.Serial = _loop_serial
+        self.name = f"mrf_test_{uuid.uuid4().hex[:12]}"
+        self.mrf = mrf_module.MRF('loop://', 115200, shared_memory_name=self.name)
+
+    def tearDown(self):
+        self.mrf.close_connection()
+        mrf_module.serial.Serial = self._serial
+
+    def test_attach_from_second_process(self):
+        values = [-1, 2, -3, 4, 5, 6, 7, 65535, 9, 40000]
+        # A frame is parsed once the next frame's header follows it
+        self.mrf.serial_connection.write(_frame(values) + b'\xf5')
+        self.assertTrue(self.mrf.receive_sensor_data())
+
+        # The child attaches, reads, closes and exits; its exit must not unlink the block
+        module_dir = os.path.dirname(os.path.abspath(mrf_module.__file__))
+        code = (
+            "import sys\n"
+            f"sys.path.insert(0, {module_dir!r})\n"
+            "import microRobotFramework_03 as m\n"
+            f"shm, sensors = m.attach_shared_sensors({self.name!r})\n"
+            "print(sensors.tolist())\n"
+            "del sensors\n"
+            "shm.close()\n"
+        )
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, timeout=30)
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), str(values))
+        self.assertNotIn('leaked', result.stderr)
+
+        # The block is still there for other readers (opened directly: this process owns it)
+        shm = shared_memory.SharedMemory(name=self.name)
+        try:
+            self.assertEqual(np.ndarray((10,), dtype=np.int32, buffer=shm.buf).tolist(), values)
+        finally:
+            shm.close()
+
+
+class _CountingHandler(logging.Handler):
+    """Counts ERROR records"""
+
+    def __init__(self):
+        super().__init__(logging.ERROR)
+        self.count = 0
+
+    def emit(self, record):
+        self.count += 1
+
+
+class _FrozenClock:
+    """
+    Stand-in for the time module in the sensor thread: monotonic() never advances, so every
+    failed read counts as a fast failure, and sleep() records its delay instead of sleeping.
+    The MRF's running event is cleared after max_sleeps sleeps, which ends the thread
+    """
+
+    def __init__(self, running: threading.Event, max_sleeps: int):
+        self.running = running
+        self.max_sleeps = max_sleeps
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return 100.0
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        if len(self.sleeps) >= self.max_sleeps:
+            self.running.clear()
+
+
+@unittest.skipUnless(os.name == 'posix', "needs a pseudo-terminal")
+class SensorThreadDisconnectTest(unittest.TestCase):
+    """The sensor thread must sleep, not spin, once the device is gone"""
+
+    SLEEPS = 14  # Enough to reach MAX_RETRY_DELAY (0.001 * 2**10 > 1.0)
+
+    def setUp(self):
+        import pty
+        import tty
+        self.master, slave = pty.openpty()
+        tty.setraw(self.master)
+        self.mrf = mrf_module.MRF(os.ttyname(slave), 115200)
+        os.close(slave)  # The MRF opened its own descriptor for the port
+        self.assertTrue(self.mrf.is_connected())
+        self.manager = mrf_module.MRFThreadManager(self.mrf)
+
+        self.errors = _CountingHandler()
+        mrf_module.logger.addHandler(self.errors)
+        self._time = mrf_module.time
+
+    def tearDown(self):
+        mrf_module.time = self._time
+        self.manager.stop_all_threads()
+        self.mrf.close_connection()
+        mrf_module.logger.removeHandler(self.errors)
+        if self.master is not None:
+            os.close(self.master)
+
+    def _unplug(self):
+        """Receive two frames, then close the peer end of the pty"""
+        os.write(self.master, _frame(range(10)) + _frame(range(10, 20)))
+        self.assertTrue(self.mrf.receive_sensor_data())
+        self.assertEqual(self.mrf.get_accel_x(), 0)
+        self.assertEqual(self.mrf.get_encoder4(), 9)
+
+        os.close(self.master)
+        self.master = None
+
+    def _run_sensor_thread(self):
+        """Run the sensor thread on a frozen clock until it has slept SLEEPS times; return (sleeps, reads)"""
+        reads = []
+        receive = self.mrf.receive_sensor_data
+
+        def counting_receive():
+            reads.append(None)
+            return receive()
+
+        self.mrf.receive_sensor_data = counting_receive
+        clock = _FrozenClock(self.mrf.running, self.SLEEPS)
+        mrf_module.time = clock
+
+        self.manager.start_sensor_thread()
+        self.manager.sensor_thread.join(timeout=10)
+        self.assertFalse(self.manager.sensor_thread.is_alive())
+        return clock.sleeps, len(reads)
+
+    def _expected_backoff(self):
+        manager = mrf_module.MRFThreadManager
+        return [min(manager.MIN_RETRY_DELAY * 2 ** index, manager.MAX_RETRY_DELAY)
+                for index in range(self.SLEEPS)]
+
+    def test_read_after_unplug_disconnects(self):
+        self._unplug()
+
+        self.assertFalse(self.mrf.receive_sensor_data())
+        self.assertFalse(self.mrf.is_connected())
+        self.assertEqual(self.errors.count, 1)
+        self.assertFalse(self.mrf.receive_sensor_data())  # Fails fast, without another error
+        self.assertEqual(self.errors.count, 1)
+
+    def test_backs_off_after_disconnect(self):
+        self._unplug()
+
+        sleeps, reads = self._run_sensor_thread()
+
+        # One doubling delay per failed read, capped at MAX_RETRY_DELAY
+        self.assertEqual(sleeps, self._expected_backoff())
+        self.assertEqual(reads, self.SLEEPS)
+        self.assertEqual(self.errors.count, 1)  # Only the read that noticed the disconnect
+        self.assertFalse(self.mrf.is_connected())
+
+    def test_backs_off_while_port_still_looks_open(self):
+        # Errors that don't mark the MRF disconnected must not make the loop spin either
+        self.mrf.is_connected = lambda: True
+        self.mrf._drop_connection = lambda: None
+        self._unplug()
+
+        sleeps, reads = self._run_sensor_thread()
+
+        self.assertEqual(sleeps, self._expected_backoff())
+        self.assertEqual(reads, self.SLEEPS)
+        self.assertEqual(self.errors.count, self.SLEEPS)  # Every read fails on the port
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,24 +7,144 @@ Provides position tracking, velocity calculation, and path recording
 
 import math
 import time
-from typing import Tuple, List, Dict, Optional
-from dataclasses import dataclass
+import numpy as np
+from typing import Tuple, List, Dict, Iterator, Optional
 
-@dataclass
 class Position:
     """Robot position data structure"""
-    x: float = 0.0
-    y: float = 0.0
-    theta: float = 0.0  # orientation in radians
-    timestamp: float = 0.0
+    __slots__ = ('x', 'y', 'theta', 'timestamp')
+
+    def __init__(self, x: float = 0.0, y: float = 0.0, theta: float = 0.0, timestamp: float = 0.0):
+        self.x = x
+        self.y = y
+        self.theta = theta  # orientation in radians
+        self.timestamp = timestamp
+
+    def __repr__(self) -> str:
+        return f"Position(x={self.x!r}, y={self.y!r}, theta={self.theta!r}, timestamp={self.timestamp!r})"
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.x, self.y, self.theta, self.timestamp) == (other.x, other.y, other.theta, other.timestamp)
 
-@dataclass
 class Velocity:
     """Robot velocity data structure"""
-    linear: float = 0.0   # m/s
-    angular: float = 0.0  # rad/s
-    left_wheel: float = 0.0   # left wheel velocity
-    right_wheel: float = 0.0  # right wheel velocity
+    __slots__ = ('linear', 'angular', 'left_wheel', 'right_wheel')
+
+    def __init__(self, linear: float = 0.0, angular: float = 0.0,
+                 left_wheel: float = 0.0, right_wheel: float = 0.0):
+        self.linear = linear    # m/s
+        self.angular = angular  # rad/s
+        self.left_wheel = left_wheel    # left wheel velocity
+        self.right_wheel = right_wheel  # right wheel velocity
+
+    def __repr__(self) -> str:
+        return (f"Velocity(linear={self.linear!r}, angular={self.angular!r}, "
+                f"left_wheel={self.left_wheel!r}, right_wheel={self.right_wheel!r})")
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return ((self.linear, self.angular, self.left_wheel, self.right_wheel) ==
+                (other.linear, other.angular, other.left_wheel, other.right_wheel))
+
+def _kinematics_step(prev_left: int, prev_right: int, left: int, right: int, theta: float,
+                     distance_per_pulse: float, wheel_base: float) -> Tuple[float, ...]:
+    """
+    Differential drive kinematics for one encoder update (pure function, no state)
+
+    Args:
+        prev_left (int): Previous left wheel encoder count
+        prev_right (int): Previous right wheel encoder count
+        left (int): Current left wheel encoder count
+        right (int): Current right wheel encoder count
+        theta (float): Current orientation in radians
+        distance_per_pulse (float): Wheel travel per encoder pulse in meters
+        wheel_base (float): Distance between wheels in meters
+
+    Returns:
+        Tuple[float, ...]: (delta_x, delta_y, delta_theta, distance_center, distance_left, distance_right)
+    """
+    # Calculate encoder deltas
+    delta_left = left - prev_left
+    delta_right = right - prev_right
+
+    # Handle encoder overflow (assuming 16-bit encoders): wrap deltas into [-32768, 32767]
+    delta_left = ((delta_left + 32768) & 0xFFFF) - 32768
+    delta_right = ((delta_right + 32768) & 0xFFFF) - 32768
+
+    # Calculate distances traveled by each wheel
+    distance_left = delta_left * distance_per_pulse
+    distance_right = delta_right * distance_per_pulse
+
+    # Calculate robot motion
+    distance_center = (distance_left + distance_right) / 2.0
+    delta_theta = (distance_right - distance_left) / wheel_base
+
+    # Update position using differential drive kinematics
+    # (_kinematics_batch applies the same formula to arrays; keep the two in step)
+    if abs(delta_theta) < 1e-6:  # Straight line motion
+        delta_x = distance_center * math.cos(theta)
+        delta_y = distance_center * math.sin(theta)
+    else:  # Curved motion
+        # Arc endpoint in sum-to-product form: sin(a + d) - sin(a) = 2 cos(a + d/2) sin(d/2) and
+        # cos(a) - cos(a + d) = 2 sin(a + d/2) sin(d/2), so 3 trig calls instead of 4
+        half_delta = delta_theta / 2.0
+        chord = 2.0 * distance_center / delta_theta * math.sin(half_delta)
+        heading = theta + half_delta
+        delta_x = chord * math.cos(heading)
+        delta_y = chord * math.sin(heading)
+
+    return delta_x, delta_y, delta_theta, distance_center, distance_left, distance_right
+
+def _kinematics_batch(prev_left: int, prev_right: int, left: np.ndarray, right: np.ndarray,
+                      theta: float, distance_per_pulse: float,
+                      wheel_base: float) -> Tuple[np.ndarray, ...]:
+    """
+    Differential drive kinematics for a run of encoder updates (vectorized _kinematics_step)
+    Each sample is one _kinematics_step, starting from the heading the previous one ended at
+
+    Args:
+        prev_left (int): Left wheel encoder count before the first sample
+        prev_right (int): Right wheel encoder count before the first sample
+        left (np.ndarray): Left wheel encoder counts (int64), oldest first
+        right (np.ndarray): Right wheel encoder counts (int64), oldest first
+        theta (float): Orientation before the first sample in radians
+        distance_per_pulse (float): Wheel travel per encoder pulse in meters
+        wheel_base (float): Distance between wheels in meters
+
+    Returns:
+        Tuple[np.ndarray, ...]: Per-sample (delta_x, delta_y, delta_theta, distance_center,
+            distance_left, distance_right)
+    """
+    # Encoder deltas, wrapped into [-32768, 32767] for 16-bit overflow
+    delta_left = ((np.diff(left, prepend=prev_left) + 32768) & 0xFFFF) - 32768
+    delta_right = ((np.diff(right, prepend=prev_right) + 32768) & 0xFFFF) - 32768
+
+    # Wheel and robot motion per sample
+    distance_left = delta_left * distance_per_pulse
+    distance_right = delta_right * distance_per_pulse
+    distance_center = (distance_left + distance_right) / 2.0
+    delta_theta = (distance_right - distance_left) / wheel_base
+
+    # Heading before each sample: theta plus the rotation of all earlier samples
+    theta_before = np.empty_like(delta_theta)
+    theta_before[0] = theta
+    np.cumsum(delta_theta[:-1], out=theta_before[1:])
+    theta_before[1:] += theta
+
+    # Straight samples move distance_center along theta; arcs move the chord along
+    # theta + delta_theta/2 (the sum-to-product form of _kinematics_step)
+    straight = np.abs(delta_theta) < 1e-6
+    half_delta = delta_theta / 2.0
+    chord = np.where(straight, distance_center,
+                     2.0 * distance_center / np.where(straight, 1.0, delta_theta) * np.sin(half_delta))
+    heading = np.where(straight, theta_before, theta_before + half_delta)
+    delta_x = chord * np.cos(heading)
+    delta_y = chord * np.sin(heading)
+
+    return delta_x, delta_y, delta_theta, distance_center, distance_left, distance_right
 
 class MRF_Odometry:
     """
@@ -59,9 +179,13 @@ class MRF_Odometry:
         # Odometry calculation parameters
         self.distance_per_pulse = (2.0 * math.pi * self.wheel_radius) / self.encoder_resolution
 
-        # Path recording
-        self.path_history: List[Position] = []
+        # Path recording: ring buffer of (x, y, theta, timestamp) rows, oldest overwritten first
         self.max_path_length = 1000  # Maximum number of positions to store
+        self._path = np.empty((self.max_path_length, 4), dtype=np.float64)
+        self._path_head = 0  # Row written by the next _record_position
+        self._path_count = 0  # Number of rows filled
+        self._path_view = self._path.view()  # Read-only alias handed out by iter_path
+        self._path_view.flags.writeable = False
 
         # Statistics
         self.total_distance = 0.0
@@ -82,83 +206,150 @@ class MRF_Odometry:
             encoder_right (int): Right wheel encoder count
 
         Returns:
-            bool: True if update successful, False otherwise
+            bool: True if updated, False if skipped (less than 1ms since the last update)
         """
-        try:
-            current_time = time.time()
-            dt = current_time - self.prev_timestamp
-
-            # Skip if time delta is too small to avoid division by zero
-            if dt < 0.001:  # Less than 1ms
-                return False
-
-            # Calculate encoder deltas
-            delta_left = encoder_left - self.prev_encoder_left
-            delta_right = encoder_right - self.prev_encoder_right
-
-            # Handle encoder overflow (assuming 16-bit encoders)
-            if abs(delta_left) > 32768:
-                if delta_left > 0:
-                    delta_left -= 65536
-                else:
-                    delta_left += 65536
-
-            if abs(delta_right) > 32768:
-                if delta_right > 0:
-                    delta_right -= 65536
-                else:
-                    delta_right += 65536
-
-            # Calculate distances traveled by each wheel
-            distance_left = delta_left * self.distance_per_pulse
-            distance_right = delta_right * self.distance_per_pulse
-
-            # Calculate robot motion
-            distance_center = (distance_left + distance_right) / 2.0
-            delta_theta = (distance_right - distance_left) / self.wheel_base
-
-            # Update position using differential drive kinematics
-            if abs(delta_theta) < 1e-6:  # Straight line motion
-                delta_x = distance_center * math.cos(self.position.theta)
-                delta_y = distance_center * math.sin(self.position.theta)
-            else:  # Curved motion
-                radius = distance_center / delta_theta
-                delta_x = radius * (math.sin(self.position.theta + delta_theta) - math.sin(self.position.theta))
-                delta_y = radius * (-math.cos(self.position.theta + delta_theta) + math.cos(self.position.theta))
-
-            # Update position
-            self.position.x += delta_x
-            self.position.y += delta_y
-            self.position.theta += delta_theta
-            self.position.timestamp = current_time
-
-            # Normalize theta to [-pi, pi]
-            self.position.theta = self._normalize_angle(self.position.theta)
-
-            # Calculate velocities
-            self.velocity.linear = distance_center / dt
-            self.velocity.angular = delta_theta / dt
-            self.velocity.left_wheel = distance_left / dt
-            self.velocity.right_wheel = distance_right / dt
-
-            # Update statistics
-            self.total_distance += abs(distance_center)
-            self.total_rotation += abs(delta_theta)
-
-            # Record path
-            self._record_position()
-
-            # Update previous values
-            self.prev_encoder_left = encoder_left
-            self.prev_encoder_right = encoder_right
-            self.prev_timestamp = current_time
-
-            return True
-
-        except Exception as e:
-            print(f"Error updating odometry: {e}")
+        current_time = time.time()
+        dt = current_time - self.prev_timestamp
+
+        # Skip if time delta is too small to avoid division by zero
+        if dt < 0.001:  # Less than 1ms
             return False
 
+        # Work on locals: one attribute lookup each instead of one per use
+        position = self.position
+        velocity = self.velocity
+        theta = position.theta
+
+        # Differential drive kinematics
+        (delta_x, delta_y, delta_theta,
+         distance_center, distance_left, distance_right) = _kinematics_step(
+            self.prev_encoder_left, self.prev_encoder_right, encoder_left, encoder_right,
+            theta, self.distance_per_pulse, self.wheel_base)
+
+        # Update position. delta_theta is small, so theta only leaves [-pi, pi] when it
+        # crosses the boundary; normalize just then
+        position.x += delta_x
+        position.y += delta_y
+        theta += delta_theta
+        if theta > math.pi or theta < -math.pi:
+            theta = self._normalize_angle(theta)
+        position.theta = theta
+        position.timestamp = current_time
+
+        # Calculate velocities
+        velocity.linear = distance_center / dt
+        velocity.angular = delta_theta / dt
+        velocity.left_wheel = distance_left / dt
+        velocity.right_wheel = distance_right / dt
+
+        # Update statistics
+        self.total_distance += abs(distance_center)
+        self.total_rotation += abs(delta_theta)
+
+        # Record path
+        self._record_position()
+
+        # Update previous values
+        self.prev_encoder_left = encoder_left
+        self.prev_encoder_right = encoder_right
+        self.prev_timestamp = current_time
+
+        return True
+
+    def update_odometry_batch(self, encoder_left, encoder_right, timestamps=None) -> int:
+        """
+        Update odometry with a batch of encoder samples in one vectorized pass
+        With timestamps, gives the same result as calling update_odometry() once per sample
+        at those times, oldest first
+
+        Args:
+            encoder_left (array-like): Left wheel encoder counts, oldest first
+            encoder_right (array-like): Right wheel encoder counts, oldest first
+            timestamps (array-like, optional): Sample times; when omitted the whole batch is
+                spread evenly from the last update to now
+
+        Returns:
+            int: Number of samples applied (a sample less than 1ms after the last applied
+                one is skipped, like in update_odometry())
+
+        Raises:
+            ValueError: If the arrays have different lengths
+        """
+        left = np.asarray(encoder_left, dtype=np.int64)
+        right = np.asarray(encoder_right, dtype=np.int64)
+        count = len(left)
+        if len(right) != count:
+            raise ValueError(f"encoder_left has {count} samples but encoder_right has {len(right)}")
+        if count == 0:
+            return 0
+
+        prev_timestamp = self.prev_timestamp
+        if timestamps is None:
+            # Sample times are unknown: only the batch as a whole has to pass the 1ms check
+            current_time = time.time()
+            if current_time - prev_timestamp < 0.001:  # Less than 1ms
+                return 0
+            times = np.linspace(prev_timestamp, current_time, count + 1)[1:]
+        else:
+            times = np.asarray(timestamps, dtype=np.float64)
+            if len(times) != count:
+                raise ValueError(f"{count} encoder samples but {len(times)} timestamps")
+
+            # Skip samples less than 1ms after the last applied one (not the previous raw one);
+            # the next applied sample covers their motion. Cheap scalar pass over the times only
+            keep = []
+            last = prev_timestamp
+            for index, sample_time in enumerate(times.tolist()):
+                if sample_time - last >= 0.001:
+                    keep.append(index)
+                    last = sample_time
+            if len(keep) < count:
+                if not keep:
+                    return 0
+                left, right, times = left[keep], right[keep], times[keep]
+                count = len(keep)
+
+        dt = np.diff(times, prepend=prev_timestamp)
+
+        # Differential drive kinematics for every sample
+        (delta_x, delta_y, delta_theta,
+         distance_center, distance_left, distance_right) = _kinematics_batch(
+            self.prev_encoder_left, self.prev_encoder_right, left, right,
+            self.position.theta, self.distance_per_pulse, self.wheel_base)
+
+        # Record every intermediate pose, then keep the last one as the current state.
+        # As in update_odometry(), theta is only normalized where it left [-pi, pi]
+        theta_after = self.position.theta + np.cumsum(delta_theta)
+        outside = np.abs(theta_after) > math.pi
+        rows = np.empty((count, 4), dtype=np.float64)
+        rows[:, 0] = self.position.x + np.cumsum(delta_x)
+        rows[:, 1] = self.position.y + np.cumsum(delta_y)
+        rows[:, 2] = np.where(outside, theta_after - math.tau * np.round(theta_after / math.tau), theta_after)
+        rows[:, 3] = times
+        self._record_positions(rows)
+
+        position = self.position
+        position.x, position.y, position.theta, position.timestamp = rows[-1].tolist()
+
+        # Velocities from the last sample, as update_odometry() would leave them
+        last_dt = float(dt[-1])
+        velocity = self.velocity
+        velocity.linear = float(distance_center[-1]) / last_dt
+        velocity.angular = float(delta_theta[-1]) / last_dt
+        velocity.left_wheel = float(distance_left[-1]) / last_dt
+        velocity.right_wheel = float(distance_right[-1]) / last_dt
+
+        # Update statistics
+        self.total_distance += float(np.abs(distance_center).sum())
+        self.total_rotation += float(np.abs(delta_theta).sum())
+
+        # Update previous values
+        self.prev_encoder_left = int(left[-1])
+        self.prev_encoder_right = int(right[-1])
+        self.prev_timestamp = float(times[-1])
+
+        return count
+
     def _normalize_angle(self, angle: float) -> float:
         """
         Normalize angle to [-pi, pi] range
@@ -169,27 +360,64 @@ class MRF_Odometry:
         Returns:
             float: Normalized angle
         """
-        while angle > math.pi:
-            angle -= 2.0 * math.pi
-        while angle < -math.pi:
-            angle += 2.0 * math.pi
-        return angle
+        # IEEE remainder: constant time for any magnitude, no loops
+        return math.remainder(angle, math.tau)
 
     def _record_position(self) -> None:
         """Record current position in path history"""
-        # Create a copy of current position
-        pos_copy = Position(
-            x=self.position.x,
-            y=self.position.y,
-            theta=self.position.theta,
-            timestamp=self.position.timestamp
-        )
+        position = self.position
+        head = self._path_head
+        self._path[head] = (position.x, position.y, position.theta, position.timestamp)
+
+        # Advance the ring buffer; once full, the oldest position is overwritten
+        self._path_head = (head + 1) % self.max_path_length
+        if self._path_count < self.max_path_length:
+            self._path_count += 1
+
+    def _record_positions(self, rows: np.ndarray) -> None:
+        """
+        Record several positions in path history at once
 
-        self.path_history.append(pos_copy)
+        Args:
+            rows (np.ndarray): (n, 4) array of x, y, theta, timestamp, oldest first
+        """
+        size = self.max_path_length
+        rows = rows[-size:]  # Older rows would be overwritten anyway
+        count = len(rows)
+        head = self._path_head
+
+        # Copy in at most two slices: up to the end of the buffer, then from its start
+        first = min(count, size - head)
+        self._path[head:head + first] = rows[:first]
+        self._path[:count - first] = rows[first:]
 
-        # Limit path history size
-        if len(self.path_history) > self.max_path_length:
-            self.path_history.pop(0)
+        self._path_head = (head + count) % size
+        self._path_count = min(self._path_count + count, size)
+
+    def _path_segments(self) -> Tuple[np.ndarray, ...]:
+        """
+        Get the recorded path as read-only views of the ring buffer, oldest first
+
+        Returns:
+            Tuple[np.ndarray, ...]: One (n, 4) view before the buffer wraps, two after
+        """
+        path = self._path_view
+        if self._path_count < self.max_path_length:
+            return (path[:self._path_count],)
+        head = self._path_head
+        return (path[head:], path[:head])
+
+    def _ordered_path(self) -> np.ndarray:
+        """
+        Get the recorded path rows, oldest first
+
+        Returns:
+            np.ndarray: (n, 4) array of x, y, theta, timestamp (a view until the ring buffer wraps)
+        """
+        segments = self._path_segments()
+        if len(segments) == 1:
+            return segments[0]
+        return np.concatenate(segments)
 
     def get_position(self) -> Position:
         """Get current robot position"""
@@ -228,9 +456,23 @@ class MRF_Odometry:
             'right_wheel': self.velocity.right_wheel
         }
 
+    def iter_path(self) -> Iterator[np.ndarray]:
+        """
+        Iterate recorded path history without copying it
+
+        Rows are read-only views into the ring buffer, so they change once
+        update_odometry() overwrites that slot; copy any row you need to keep.
+
+        Returns:
+            Iterator[np.ndarray]: (x, y, theta, timestamp) rows, oldest first
+        """
+        for segment in self._path_segments():
+            yield from segment
+
     def get_path_history(self) -> List[Position]:
-        """Get recorded path history"""
-        return self.path_history.copy()
+        """Get a copy of recorded path history (use iter_path() to avoid the copy)"""
+        return [Position(x, y, theta, timestamp)
+                for x, y, theta, timestamp in self._ordered_path().tolist()]
 
     def get_statistics(self) -> Dict:
         """Get odometry statistics"""
@@ -238,7 +480,7 @@ class MRF_Odometry:
             'total_distance': self.total_distance,
             'total_rotation': self.total_rotation,
             'total_rotation_degrees': math.degrees(self.total_rotation),
-            'path_points': len(self.path_history),
+            'path_points': self._path_count,
             'current_position': self.get_position_dict(),
             'current_velocity': self.get_velocity_dict()
         }
@@ -247,7 +489,8 @@ class MRF_Odometry:
         """Reset odometry to origin"""
         self.position = Position()
         self.velocity = Velocity()
-        self.path_history.clear()
+        self._path_head = 0
+        self._path_count = 0
         self.total_distance = 0.0
         self.total_rotation = 0.0
         self.prev_timestamp = time.time()
@@ -305,19 +548,11 @@ class MRF_Odometry:
         Returns:
             float: Path length in meters
         """
-        if len(self.path_history) < 2:
+        if self._path_count < 2:
             return 0.0
 
-        total_length = 0.0
-        for i in range(1, len(self.path_history)):
-            prev_pos = self.path_history[i-1]
-            curr_pos = self.path_history[i]
-
-            dx = curr_pos.x - prev_pos.x
-            dy = curr_pos.y - prev_pos.y
-            total_length += math.sqrt(dx*dx + dy*dy)
-
-        return total_length
+        path = self._ordered_path()
+        return float(np.hypot(np.diff(path[:, 0]), np.diff(path[:, 1])).sum())
 
     def export_path_to_dict(self) -> List[Dict]:
         """
@@ -326,16 +561,13 @@ class MRF_Odometry:
         Returns:
             List[Dict]: Path data
         """
-        return [
-            {
-                'x': pos.x,
-                'y': pos.y,
-                'theta': pos.theta,
-                'theta_degrees': math.degrees(pos.theta),
-                'timestamp': pos.timestamp
-            }
-            for pos in self.path_history
-        ]
+        keys = ('x', 'y', 'theta', 'theta_degrees', 'timestamp')
+        path = []
+        for segment in self._path_segments():
+            # Convert all angles in one ufunc call, then build each dict from a plain row
+            table = np.column_stack((segment[:, :3], np.rad2deg(segment[:, 2]), segment[:, 3]))
+            path.extend(dict(zip(keys, row)) for row in table.tolist())
+        return path
 
     def __str__(self) -> str:
         """String representation of odometry state"""
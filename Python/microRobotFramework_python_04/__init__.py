@@ -18,7 +18,7 @@ Version 04 Features:
 - Data logging and export capabilities
 """
 
-from .microRobotFramework_04 import MRF
+from .microRobotFramework_04 import MRF, SensorSnapshot
 from .MRF_odometry import MRF_Odometry, Position, Velocity
 
 __version__ = "1.0.0"
@@ -29,6 +29,7 @@ __description__ = "Python version of microRobotFramework_04 for 2-wheel robot co
 # Package metadata
 __all__ = [
     'MRF',
+    'SensorSnapshot',
     'MRF_Odometry',
     'Position',
     'Velocity',
@@ -5,11 +5,49 @@ Converted from microRobotFramework.hpp and microRobotFramework.cpp (version 04)
 Includes enhanced motor control with speed and angle parameters
 """
 
+import numpy as np
+import os
+import select
 import serial
 import struct
 import time
 import math
-from typing import Optional, Tuple
+import threading
+from collections import deque
+from typing import Callable, NamedTuple, Optional, Tuple
+
+# Sensor payload after the header byte, big-endian as sent by the firmware
+_IMU_DTYPE = np.dtype('>i2')  # 6 IMU values: signed 16-bit
+_ENC_DTYPE = np.dtype('>u2')  # 4 encoder counts: unsigned 16-bit
+
+# Motor command packet: header byte + left speed + right speed (little-endian int16)
+_CMD_STRUCT = struct.Struct('<Bhh')
+
+class SensorSnapshot(NamedTuple):
+    """All sensor values from one received frame"""
+    ax: int  # accel x
+    ay: int  # accel y
+    az: int  # accel z
+    gx: int  # gyro x
+    gy: int  # gyro y
+    gz: int  # gyro z
+    e1: int  # encoder 1
+    e2: int  # encoder 2
+    e3: int  # encoder 3
+    e4: int  # encoder 4
+
+    def to_dict(self) -> dict:
+        """Get the values as a nested dictionary (accel / gyro / encoders)"""
+        return {
+            'accel': {'x': self.ax, 'y': self.ay, 'z': self.az},
+            'gyro': {'x': self.gx, 'y': self.gy, 'z': self.gz},
+            'encoders': {
+                'encoder1': self.e1,
+                'encoder2': self.e2,
+                'encoder3': self.e3,
+                'encoder4': self.e4
+            }
+        }
 
 class MRF:
     """
@@ -20,6 +58,10 @@ class MRF:
 
     # Constants
     HEADER_BYTE = 0xF5  # Header byte for serial communication
+    MOTOR_HEADER = 0xFA  # Header byte for motor commands
+    FRAME_SIZE = 21  # Header + 20 data bytes, as sent by mpu6050_get_raw_data_04.ino
+    RX_BUFFER_SIZE = 1024  # Receive buffer capacity (about 48 frames)
+    RX_QUEUE_SIZE = 256  # Snapshots kept by the receiver thread; the oldest are dropped first
 
     def __init__(self, port: str, baud_rate: int):
         """
@@ -33,26 +75,39 @@ class MRF:
         self.baud_rate = baud_rate
         self.connected = False
         self.serial_connection: Optional[serial.Serial] = None
-
-        # IMU Data
-        self.accel_x = 0
-        self.accel_y = 0
-        self.accel_z = 0
-        self.gyro_x = 0
-        self.gyro_y = 0
-        self.gyro_z = 0
+        self._cmd_buf = bytearray(_CMD_STRUCT.size)  # Reused for every motor command
+        self._io: Optional[serial.Serial] = None  # Open port used on the hot path, None when disconnected
+        self._fd: Optional[int] = None  # Raw file descriptor of the port (POSIX only)
+        # Fixed receive buffer: bytes not yet consumed as a frame are kept at the front
+        self._rx_buffer = bytearray(self.RX_BUFFER_SIZE)
+        self._rx_view = memoryview(self._rx_buffer)
+        self._rx_length = 0
+        # Fixed frame payload buffer with typed views over it, built once so parsing a
+        # frame creates no new arrays or int objects
+        self._frame_buf = bytearray(20)
+        self._frame_imu = np.frombuffer(self._frame_buf, dtype=_IMU_DTYPE, count=6)
+        self._frame_enc = np.frombuffer(self._frame_buf, dtype=_ENC_DTYPE, count=4, offset=12)
+
+        # IMU Data: accel x/y/z, gyro x/y/z (updated in place by every frame)
+        self._imu = np.zeros(6, dtype=np.int16)
         self.pitch = 0.0
         self.roll = 0.0
         self.yaw = 0.0
 
-        # Encoder Data
-        self.encoder1 = 0
-        self.encoder2 = 0
-        self.encoder3 = 0
-        self.encoder4 = 0
+        # Encoder Data: encoder 1-4 (updated in place by every frame)
+        self._enc = np.zeros(4, dtype=np.uint16)
+
+        # Background receiver (see start_receiver): it appends one (receive time, snapshot) pair
+        # per frame and sets the event; one producer and deque append/pop are atomic, so no lock is needed
+        self.rx_snapshots = deque(maxlen=self.RX_QUEUE_SIZE)
+        self.new_data_event = threading.Event()
+        self._rx_running = threading.Event()
+        self._rx_thread: Optional[threading.Thread] = None
 
         # Initialize serial connection
         self.connected = self._open_serial()
+        if self.connected:
+            self._io = self.serial_connection
 
     def _open_serial(self) -> bool:
         """
@@ -70,6 +125,13 @@ class MRF:
                 parity=serial.PARITY_NONE,
                 stopbits=serial.STOPBITS_ONE
             )
+
+            # Raw descriptor for reading into the receive buffer and writing commands; pyserial is used without it
+            try:
+                self._fd = self.serial_connection.fileno()
+            except (AttributeError, ValueError, OSError):
+                self._fd = None
+
             return True
         except (serial.SerialException, OSError) as e:
             print(f"Error opening serial port {self.serial_port}: {e}")
@@ -87,52 +149,144 @@ class MRF:
     def receive_sensor_data(self) -> bool:
         """
         Receive sensor data from serial port (IMU + Encoder data)
-        Reads 23 bytes total: header + 22 data bytes
+        Frames are 21 bytes: header (0xF5) + 20 data bytes. Everything already waiting is read
+        at once and every complete frame is parsed, leaving the latest in the getters.
+        A frame is only parsed once the next frame's header byte follows it, so bytes before a
+        header and a 0xF5 inside the data are skipped instead of misaligning the stream.
+        The newest frame is therefore returned when the next one starts to arrive
 
         Returns:
             bool: True if data received successfully, False otherwise
         """
-        if not self.is_connected():
-            return False
+        return self._receive_frames() > 0
 
-        try:
-            # Read 23 bytes of data
-            buffer = self.serial_connection.read(23)
-            if len(buffer) != 23:
-                return False  # Incomplete packet
-
-            # Parse the data (assuming big-endian format based on C++ code)
-            # Skip first 2 bytes (header), then parse sensor data
-            self.accel_x = (buffer[2] << 8) | buffer[3]
-            self.accel_y = (buffer[4] << 8) | buffer[5]
-            self.accel_z = (buffer[6] << 8) | buffer[7]
-            self.gyro_x = (buffer[8] << 8) | buffer[9]
-            self.gyro_y = (buffer[10] << 8) | buffer[11]
-            self.gyro_z = (buffer[12] << 8) | buffer[13]
-            self.encoder1 = (buffer[14] << 8) | buffer[15]
-            self.encoder2 = (buffer[16] << 8) | buffer[17]
-            self.encoder3 = (buffer[18] << 8) | buffer[19]
-            self.encoder4 = (buffer[20] << 8) | buffer[21]
-
-            # Convert to signed integers for IMU data
-            if self.accel_x > 32767:
-                self.accel_x -= 65536
-            if self.accel_y > 32767:
-                self.accel_y -= 65536
-            if self.accel_z > 32767:
-                self.accel_z -= 65536
-            if self.gyro_x > 32767:
-                self.gyro_x -= 65536
-            if self.gyro_y > 32767:
-                self.gyro_y -= 65536
-            if self.gyro_z > 32767:
-                self.gyro_z -= 65536
+    def _receive_frames(self, on_frame: Optional[Callable[[], None]] = None) -> int:
+        """
+        Parse every complete frame in the receive buffer, reading (up to the port timeout)
+        until there is at least one
 
-            return True
+        Args:
+            on_frame (Callable, optional): Called after each parsed frame, while the getters
+                hold that frame's values
+
+        Returns:
+            int: Number of frames parsed (0 on timeout or error)
+        """
+        # The cached handle is None until the port opens, after close_connection() and
+        # after a read/write error (see _drop_connection)
+        io = self._io
+        if io is None:
+            return 0
+
+        try:
+            buffer = self._rx_buffer
+            view = self._rx_view
+            length = self._rx_length
+            header = self.HEADER_BYTE
+            frame_size = self.FRAME_SIZE
+            timed_out = False
+            while True:
+                parsed = 0
+                position = 0
+                while True:
+                    # Resync: skip everything before the next header byte
+                    start = buffer.find(header, position, length)
+                    if start < 0:
+                        position = length
+                        break
+                    end = start + frame_size
+                    # A 0xF5 inside the data looks like a header too: only trust one that the
+                    # next frame's header follows, so the frame is complete and aligned
+                    if length <= end:
+                        position = start
+                        break
+                    if buffer[end] != header:
+                        position = start + 1
+                        continue
+
+                    # Parse the data (big-endian format based on C++ code), skipping the header byte
+                    # IMU values are signed, encoders unsigned
+                    self._frame_buf[:] = view[start + 1:end]
+                    self._imu[:] = self._frame_imu
+                    self._enc[:] = self._frame_enc
+                    position = end
+                    parsed += 1
+                    if on_frame is not None:
+                        on_frame()
+
+                # Move the unparsed tail to the front for the next call
+                if position:
+                    view[:length - position] = view[position:length]
+                    length -= position
+                    self._rx_length = length
+                if parsed or timed_out:
+                    return parsed
+
+                # Read whatever has arrived, or block (up to the timeout) for the rest of the frame
+                # and the first byte of the next one
+                wanted = min(io.in_waiting or frame_size + 1 - length, self.RX_BUFFER_SIZE - length)
+                count = self._read_into(io, view[length:length + wanted])
+                length += count
+                self._rx_length = length
+                timed_out = count < wanted
 
         except (serial.SerialException, OSError) as e:
             print(f"Error reading serial data: {e}")
-            return False
+            self._drop_connection()
+            return 0
+
+    def _drop_connection(self) -> None:
+        """
+        Stop using the port after a read/write error
+        pyserial keeps is_open True after errors such as EIO on an unplugged device, so the
+        cached handles are dropped here; later calls fail fast until close_connection()
+        """
+        self._io = None
+        self._fd = None
+        self.connected = False
+
+    def _read_into(self, io: serial.Serial, view: memoryview) -> int:
+        """
+        Read into view, blocking until it is full or the port timeout expires
+        Uses os.readv on the raw file descriptor when available, so no bytes object is created
+
+        Args:
+            io (serial.Serial): Open port (the caller's cached handle)
+            view (memoryview): Writable target buffer
+
+        Returns:
+            int: Number of bytes read (less than len(view) on timeout)
+        """
+        fd = self._fd
+        if fd is None:
+            return io.readinto(view)
+
+        size = len(view)
+        received = 0
+        deadline = None
+        readable = False  # select() reported data that the last read hasn't returned yet
+        while received < size:
+            try:
+                count = os.readv(fd, (view[received:],))
+            except BlockingIOError:
+                count = 0  # Port is non-blocking and nothing has arrived yet
+
+            if count:
+                received += count
+                readable = False
+                continue
+            if readable:
+                # Readable but empty: the device was disconnected
+                raise serial.SerialException("device reports readiness to read but returned no data")
+
+            # Wait for more data until the port timeout expires
+            if deadline is None:
+                deadline = time.monotonic() + io.timeout
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select((fd,), (), (), remaining)[0]:
+                break
+            readable = True
+        return received
 
     def send_motor_command(self, speed: int, angle: int) -> bool:
         """
@@ -145,28 +299,64 @@ class MRF:
         Returns:
             bool: True if command sent successfully, False otherwise
         """
-        if not self.is_connected():
+        io = self._io  # See _receive_frames()
+        if io is None:
             return False
 
-        # Validate input ranges
-        speed = max(-100, min(100, speed))
-        angle = max(-100, min(100, angle))
+        # Validate input ranges (comparison chains instead of min/max calls)
+        if speed > 100:
+            speed = 100
+        elif speed < -100:
+            speed = -100
+        if angle > 100:
+            angle = 100
+        elif angle < -100:
+            angle = -100
 
         # Convert speed and angle to left/right motor speeds
-        left_speed, right_speed = self._calculate_differential_speeds(speed, angle)
+        if angle == 0:  # Straight (move_forward/backward, stop_motors): both wheels at speed
+            left_speed = right_speed = speed
+        else:
+            left_speed, right_speed = self._calculate_differential_speeds(speed, angle)
 
         try:
-            # Create motor command packet (assuming similar format to previous versions)
+            # Fill the motor command packet in place (assuming similar format to previous versions)
             # Header byte + left speed + right speed
-            command = struct.pack('<Bhh', 0xFA, left_speed, right_speed)
+            command = self._cmd_buf
+            _CMD_STRUCT.pack_into(command, 0, self.MOTOR_HEADER, left_speed, right_speed)
 
-            self.serial_connection.write(command)
+            self._write(io, command)
             return True
 
         except (serial.SerialException, OSError) as e:
             print(f"Error sending motor command: {e}")
+            self._drop_connection()
             return False
 
+    def _write(self, io: serial.Serial, data) -> int:
+        """
+        Write data to the serial port
+        Uses os.write on the raw file descriptor when available, bypassing pyserial's write loop
+
+        Args:
+            io (serial.Serial): Open port (the caller's cached handle)
+            data (bytes-like): Data to send
+
+        Returns:
+            int: Number of bytes written
+        """
+        fd = self._fd
+        if fd is None:
+            return io.write(data)
+
+        try:
+            written = os.write(fd, data)
+        except BlockingIOError:
+            written = 0
+        if written < len(data):
+            written += io.write(data[written:])  # Output buffer full: let pyserial wait
+        return written
+
     def _calculate_differential_speeds(self, speed: int, angle: int) -> Tuple[int, int]:
         """
         Calculate left and right motor speeds from speed and angle
@@ -178,17 +368,13 @@ class MRF:
         Returns:
             Tuple[int, int]: (left_speed, right_speed)
         """
-        # Convert angle to differential factor
-        angle_factor = angle / 100.0  # Normalize to -1.0 to +1.0
-
-        if angle_factor >= 0:  # Turn right
-            left_speed = speed
-            right_speed = int(speed * (1.0 - angle_factor))
-        else:  # Turn left
-            left_speed = int(speed * (1.0 + angle_factor))
-            right_speed = speed
+        # Slow the inner wheel by angle percent, in integer math (truncating toward zero)
+        reduced = speed * (100 - abs(angle))
+        reduced = reduced // 100 if reduced >= 0 else -(-reduced // 100)
 
-        return left_speed, right_speed
+        if angle >= 0:  # Turn right
+            return speed, reduced
+        return reduced, speed  # Turn left
 
     # Convenience methods for common movements
     def move_forward(self, speed: int = 50) -> bool:
@@ -214,60 +400,176 @@ class MRF:
     # Getter methods for IMU data
     def get_accel_x(self) -> int:
         """Get X-axis acceleration"""
-        return self.accel_x
+        return int(self._imu[0])
 
     def get_accel_y(self) -> int:
         """Get Y-axis acceleration"""
-        return self.accel_y
+        return int(self._imu[1])
 
     def get_accel_z(self) -> int:
         """Get Z-axis acceleration"""
-        return self.accel_z
+        return int(self._imu[2])
 
     def get_gyro_x(self) -> int:
         """Get X-axis gyroscope data"""
-        return self.gyro_x
+        return int(self._imu[3])
 
     def get_gyro_y(self) -> int:
         """Get Y-axis gyroscope data"""
-        return self.gyro_y
+        return int(self._imu[4])
 
     def get_gyro_z(self) -> int:
         """Get Z-axis gyroscope data"""
-        return self.gyro_z
+        return int(self._imu[5])
 
     # Getter methods for Encoder data
     def get_encoder1(self) -> int:
         """Get encoder 1 value"""
-        return self.encoder1
+        return int(self._enc[0])
 
     def get_encoder2(self) -> int:
         """Get encoder 2 value"""
-        return self.encoder2
+        return int(self._enc[1])
 
     def get_encoder3(self) -> int:
         """Get encoder 3 value"""
-        return self.encoder3
+        return int(self._enc[2])
 
     def get_encoder4(self) -> int:
         """Get encoder 4 value"""
-        return self.encoder4
+        return int(self._enc[3])
+
+    # IMU and encoder data (read-only, same values as the getters)
+    @property
+    def accel_x(self) -> int:
+        """X-axis acceleration"""
+        return int(self._imu[0])
+
+    @property
+    def accel_y(self) -> int:
+        """Y-axis acceleration"""
+        return int(self._imu[1])
+
+    @property
+    def accel_z(self) -> int:
+        """Z-axis acceleration"""
+        return int(self._imu[2])
+
+    @property
+    def gyro_x(self) -> int:
+        """X-axis gyroscope data"""
+        return int(self._imu[3])
+
+    @property
+    def gyro_y(self) -> int:
+        """Y-axis gyroscope data"""
+        return int(self._imu[4])
+
+    @property
+    def gyro_z(self) -> int:
+        """Z-axis gyroscope data"""
+        return int(self._imu[5])
+
+    @property
+    def encoder1(self) -> int:
+        """Encoder 1 value"""
+        return int(self._enc[0])
+
+    @property
+    def encoder2(self) -> int:
+        """Encoder 2 value"""
+        return int(self._enc[1])
+
+    @property
+    def encoder3(self) -> int:
+        """Encoder 3 value"""
+        return int(self._enc[2])
+
+    @property
+    def encoder4(self) -> int:
+        """Encoder 4 value"""
+        return int(self._enc[3])
+
+    # Bulk accessors for vectorized math (copies, so they don't change under the caller)
+    def get_accel_vec(self) -> np.ndarray:
+        """Get accel x/y/z as an int16 array"""
+        return self._imu[:3].copy()
+
+    def get_gyro_vec(self) -> np.ndarray:
+        """Get gyro x/y/z as an int16 array"""
+        return self._imu[3:].copy()
+
+    def get_encoder_vec(self) -> np.ndarray:
+        """Get encoder 1-4 as a uint16 array"""
+        return self._enc.copy()
+
+    def snapshot(self) -> SensorSnapshot:
+        """
+        Read every sensor value at once (one call instead of ten get_* calls)
 
-    def get_all_sensor_data(self) -> dict:
-        """Get all sensor data as dictionary"""
-        return {
-            'accel': {'x': self.accel_x, 'y': self.accel_y, 'z': self.accel_z},
-            'gyro': {'x': self.gyro_x, 'y': self.gyro_y, 'z': self.gyro_z},
-            'encoders': {
-                'encoder1': self.encoder1,
-                'encoder2': self.encoder2,
-                'encoder3': self.encoder3,
-                'encoder4': self.encoder4
-            }
-        }
+        Returns:
+            SensorSnapshot: ax, ay, az, gx, gy, gz, e1-e4 (call .to_dict() for the nested dictionary)
+        """
+        return SensorSnapshot._make(self._imu.tolist() + self._enc.tolist())
+
+    def get_all_sensor_data(self) -> SensorSnapshot:
+        """Get all sensor data as one tuple (same as snapshot())"""
+        return self.snapshot()
+
+    def start_receiver(self) -> bool:
+        """
+        Start a background thread that receives sensor frames
+        A (receive time, SensorSnapshot) pair for every frame is appended to rx_snapshots and
+        new_data_event is set. The receive time is time.time(), the clock MRF_Odometry uses.
+        While it runs, read rx_snapshots instead of calling receive_sensor_data()
+
+        Returns:
+            bool: True if the receiver is running, False if not connected
+        """
+        if self._rx_thread is not None and self._rx_thread.is_alive():
+            return True
+        if not self.is_connected():
+            return False
+
+        self._rx_running.set()
+        self._rx_thread = threading.Thread(target=self._rx_loop, daemon=True)
+        self._rx_thread.start()
+        return True
+
+    def _rx_loop(self) -> None:
+        """Receiver thread body: runs until stop_receiver() or the port goes away"""
+        # Bind hot-loop methods once instead of looking them up every iteration
+        is_running = self._rx_running.is_set
+        receive = self._receive_frames
+        snapshot = self.snapshot
+        push = self.rx_snapshots.append
+        notify = self.new_data_event.set
+        stamp = time.time
+
+        def push_snapshot():
+            push((stamp(), snapshot()))
+
+        # _receive_frames() blocks (up to the port timeout) while waiting for data and
+        # pushes a snapshot of every frame, also when several arrived at once
+        while is_running():
+            if receive(push_snapshot):
+                notify()
+            elif not self.is_connected():
+                break
+
+    def stop_receiver(self) -> None:
+        """Stop the background receiver thread, if running"""
+        self._rx_running.clear()
+        thread = self._rx_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+        self._rx_thread = None
 
     def close_connection(self) -> None:
         """Close serial connection"""
+        self.stop_receiver()
+        self._io = None
+        self._fd = None
         if self.serial_connection and self.serial_connection.is_open:
             self.serial_connection.close()
         self.connected = False
@@ -17,11 +17,25 @@ Usage:
 import time
 import sys
 import json
+import math
+import queue
 import threading
+from collections import deque
 from datetime import datetime
 from microRobotFramework_04 import MRF
 from MRF_odometry import MRF_Odometry
 
+_RAD2DEG = 180.0 / math.pi  # Radians to degrees, multiplied in the display code
+
+# Preformatted status block, written to stdout in one call per display tick
+_STATUS_FMT = (
+    "🔄 IMU    - Accel: ({:6d}, {:6d}, {:6d}) Gyro: ({:6d}, {:6d}, {:6d})\n"
+    "⚙️  ENC    - Left: {:6d}  Right: {:6d}\n"
+    "📍 POS    - X: {:7.3f}m  Y: {:7.3f}m  θ: {:6.1f}°\n"
+    "🏃 VEL    - Linear: {:6.3f}m/s  Angular: {:6.1f}°/s\n"
+    + "-" * 60 + "\n"
+).format
+
 class RobotController:
     """
     Main robot controller class that integrates MRF and odometry
@@ -43,9 +57,20 @@ class RobotController:
         )
 
         self.running = False
-        self.data_log = []
+        self.data_log = deque(maxlen=1000)  # Oldest entries drop off to limit memory use
         self.log_interval = 0.1  # Log data every 100ms
 
+        # Encoder samples (left, right, receive time) handed from the monitoring loop to the
+        # odometry worker. Bounded: if the worker falls behind, new samples are dropped (the
+        # next one still carries the full encoder count, so no distance is lost)
+        self.odometry_queue = queue.Queue(maxsize=64)
+
+        # (position dict, velocity dict) published by whichever thread updates the odometry.
+        # Readers on other threads use this instead of the live MRF_Odometry objects, which
+        # the worker changes field by field; replacing the tuple is a single atomic store
+        self.odometry_state = None
+        self._publish_odometry()
+
     def start_monitoring(self):
         """Start sensor monitoring and odometry updates"""
         self.running = True
@@ -55,49 +80,113 @@ class RobotController:
         print("Press Ctrl+C to stop")
         print("-" * 60)
 
-        try:
-            last_log_time = time.time()
+        # Odometry runs in its own thread so its math overlaps with waiting on the serial port
+        self._publish_odometry()
+        odometry_worker = threading.Thread(target=self._odometry_worker, daemon=True)
+        odometry_worker.start()
 
-            while self.running:
-                # Receive sensor data
-                if self.mrf.receive_sensor_data():
-                    # Update odometry with encoder data
-                    encoder_left = self.mrf.get_encoder1()  # Assuming encoder1 is left wheel
-                    encoder_right = self.mrf.get_encoder2()  # Assuming encoder2 is right wheel
+        # Serial reads run on the MRF receiver thread, so a slow display or log never
+        # delays reading the port; this loop forwards frames and displays
+        self.mrf.start_receiver()
 
-                    self.odometry.update_odometry(encoder_left, encoder_right)
+        # Bind hot-loop lookups once instead of resolving them every iteration
+        enqueue = self.odometry_queue.put_nowait
+        snapshots = self.mrf.rx_snapshots
+        next_snapshot = snapshots.popleft
+        new_data = self.mrf.new_data_event
+        # Intervals use the monotonic clock: immune to wall-clock steps, and integer ns needs no float
+        now = time.monotonic_ns
+        log_interval = int(self.log_interval * 1e9)
 
-                    # Log data periodically
-                    current_time = time.time()
-                    if current_time - last_log_time >= self.log_interval:
-                        self._log_data()
-                        self._display_status()
-                        last_log_time = current_time
+        try:
+            last_log_time = now()
+            latest = None  # Newest snapshot, shared by the log entry and status display
 
-                time.sleep(0.01)  # 10ms loop
+            while self.running:
+                # Sleep until the receiver has new frames (or 100ms pass with none)
+                if not new_data.wait(0.1):
+                    continue
+                new_data.clear()
+
+                # Hand encoder data of every new frame to the odometry worker, oldest first,
+                # with the time the receiver got the frame
+                while snapshots:
+                    received_at, latest = next_snapshot()
+                    try:
+                        enqueue((latest.e1, latest.e2, received_at))  # Assuming encoder1 is left wheel, encoder2 right
+                    except queue.Full:
+                        pass  # Worker is behind: drop this sample
+
+                # Log data periodically. Only values handed over by the other threads are used:
+                # the receiver's snapshot (the MRF arrays change under it) and one published
+                # odometry state, so the log entry and the display show the same pose
+                current_time = now()
+                if latest is not None and current_time - last_log_time >= log_interval:
+                    odometry_state = self.odometry_state
+                    self._log_data(latest, odometry_state)
+                    self._display_status(latest, odometry_state)
+                    last_log_time = current_time
 
         except KeyboardInterrupt:
             print("\n🛑 Monitoring stopped by user")
         except Exception as e:
             print(f"❌ Error during monitoring: {e}")
         finally:
+            self.mrf.stop_receiver()
+            self.odometry_queue.put(None)  # Stop the worker once it has drained the queue
+            odometry_worker.join(timeout=1.0)
             self.stop_monitoring()
 
-    def _log_data(self):
-        """Log current sensor and odometry data"""
-        timestamp = time.time()
+    def _odometry_worker(self):
+        """Update odometry from queued encoder samples until a None sample arrives"""
+        get = self.odometry_queue.get
+        get_nowait = self.odometry_queue.get_nowait
+        update_batch = self.odometry.update_odometry_batch
+        publish = self._publish_odometry
+
+        running = True
+        while running:
+            # Wait for one sample, then take everything else already queued and
+            # integrate the whole batch in one vectorized update
+            batch = [get()]
+            try:
+                while True:
+                    batch.append(get_nowait())
+            except queue.Empty:
+                pass
+
+            if None in batch:
+                batch = batch[:batch.index(None)]
+                running = False
+            if batch:
+                left, right, times = zip(*batch)
+                update_batch(left, right, times)
+                publish()
+
+    def _publish_odometry(self):
+        """Publish a consistent copy of the current pose and velocity (see odometry_state)"""
+        self.odometry_state = (self.odometry.get_position_dict(), self.odometry.get_velocity_dict())
+
+    def _log_data(self, sensor_data=None, odometry_state=None):
+        """
+        Log current sensor and odometry data
+
+        Args:
+            sensor_data (SensorSnapshot, optional): Sensor values to log; read from the MRF when omitted
+            odometry_state (tuple, optional): (position, velocity) dicts; odometry_state when omitted
+        """
+        timestamp = time.time()  # Wall-clock stamp for the saved log; intervals use time.monotonic
 
-        # Get all sensor data
-        sensor_data = self.mrf.get_all_sensor_data()
+        # Get all sensor data (kept as a tuple; converted to a dictionary when saved)
+        if sensor_data is None:
+            sensor_data = self.mrf.snapshot()
 
-        # Get odometry data
-        position = self.odometry.get_position_dict()
-        velocity = self.odometry.get_velocity_dict()
+        # Get odometry data: the worker's last published state, never a half-updated pose
+        position, velocity = odometry_state or self.odometry_state
 
-        # Create log entry
+        # Create log entry (the readable datetime is added when the log is saved)
         log_entry = {
             'timestamp': timestamp,
-            'datetime': datetime.fromtimestamp(timestamp).isoformat(),
             'sensors': sensor_data,
             'position': position,
             'velocity': velocity
@@ -105,34 +194,26 @@ class RobotController:
 
         self.data_log.append(log_entry)
 
-        # Limit log size to prevent memory issues
-        if len(self.data_log) > 1000:
-            self.data_log.pop(0)
-
-    def _display_status(self):
-        """Display current robot status"""
-        # Get current data
-        accel_x = self.mrf.get_accel_x()
-        accel_y = self.mrf.get_accel_y()
-        accel_z = self.mrf.get_accel_z()
-
-        gyro_x = self.mrf.get_gyro_x()
-        gyro_y = self.mrf.get_gyro_y()
-        gyro_z = self.mrf.get_gyro_z()
+    def _display_status(self, sensor_data=None, odometry_state=None):
+        """
+        Display current robot status
 
-        enc1 = self.mrf.get_encoder1()
-        enc2 = self.mrf.get_encoder2()
+        Args:
+            sensor_data (SensorSnapshot, optional): Sensor values to show; read from the MRF when omitted
+            odometry_state (tuple, optional): (position, velocity) dicts; odometry_state when omitted
+        """
+        # Get current data: one snapshot instead of a getter call per value
+        if sensor_data is None:
+            sensor_data = self.mrf.snapshot()
+        accel_x, accel_y, accel_z, gyro_x, gyro_y, gyro_z, enc1, enc2 = sensor_data[:8]
 
-        position = self.odometry.get_position()
-        velocity = self.odometry.get_velocity()
+        position, velocity = odometry_state or self.odometry_state  # See _log_data
 
         # Display formatted data
-        print(f"🔄 IMU    - Accel: ({accel_x:6d}, {accel_y:6d}, {accel_z:6d}) "
-              f"Gyro: ({gyro_x:6d}, {gyro_y:6d}, {gyro_z:6d})")
-        print(f"⚙️  ENC    - Left: {enc1:6d}  Right: {enc2:6d}")
-        print(f"📍 POS    - X: {position.x:7.3f}m  Y: {position.y:7.3f}m  θ: {position.theta*180/3.14159:6.1f}°")
-        print(f"🏃 VEL    - Linear: {velocity.linear:6.3f}m/s  Angular: {velocity.angular*180/3.14159:6.1f}°/s")
-        print("-" * 60)
+        sys.stdout.write(_STATUS_FMT(accel_x, accel_y, accel_z, gyro_x, gyro_y, gyro_z,
+                                     enc1, enc2,
+                                     position['x'], position['y'], position['theta_degrees'],
+                                     velocity['linear'], velocity['angular_degrees']))
 
     def stop_monitoring(self):
         """Stop monitoring and cleanup"""
@@ -141,6 +222,26 @@ class RobotController:
         print("🔌 Closing connections...")
         self.mrf.close_connection()
 
+    def _track_odometry(self, duration: float):
+        """
+        Update odometry from every sensor packet received during the next duration seconds
+
+        Args:
+            duration (float): Tracking time in seconds
+        """
+        # receive_sensor_data() blocks until a packet arrives (or its 100ms timeout),
+        # so the loop is paced by the sensor stream instead of a fixed sleep
+        receive = self.mrf.receive_sensor_data
+        get_encoder_left = self.mrf.get_encoder1
+        get_encoder_right = self.mrf.get_encoder2
+        update = self.odometry.update_odometry
+        monotonic = time.monotonic
+
+        deadline = monotonic() + duration
+        while monotonic() < deadline:
+            if receive():
+                update(get_encoder_left(), get_encoder_right())
+
     def run_basic_movement_demo(self):
         """Run basic movement demonstration"""
         print("🎮 Starting basic movement demo...")
@@ -161,13 +262,7 @@ class RobotController:
             movement_func()
 
             # Monitor during movement
-            start_time = time.time()
-            while time.time() - start_time < duration:
-                if self.mrf.receive_sensor_data():
-                    encoder_left = self.mrf.get_encoder1()
-                    encoder_right = self.mrf.get_encoder2()
-                    self.odometry.update_odometry(encoder_left, encoder_right)
-                time.sleep(0.05)
+            self._track_odometry(duration)
 
         print("✅ Movement demo completed!")
 
@@ -191,25 +286,13 @@ class RobotController:
             self.mrf.move_forward(60)
 
             # Move forward for 3 seconds while monitoring
-            start_time = time.time()
-            while time.time() - start_time < 3.0:
-                if self.mrf.receive_sensor_data():
-                    encoder_left = self.mrf.get_encoder1()
-                    encoder_right = self.mrf.get_encoder2()
-                    self.odometry.update_odometry(encoder_left, encoder_right)
-                time.sleep(0.05)
+            self._track_odometry(3.0)
 
             print(f"🎯 Corner {i+1}/4: Turning right...")
             self.mrf.turn_right(50, 80)
 
             # Turn for 1.5 seconds
-            start_time = time.time()
-            while time.time() - start_time < 1.5:
-                if self.mrf.receive_sensor_data():
-                    encoder_left = self.mrf.get_encoder1()
-                    encoder_right = self.mrf.get_encoder2()
-                    self.odometry.update_odometry(encoder_left, encoder_right)
-                time.sleep(0.05)
+            self._track_odometry(1.5)
 
         # Stop motors
         self.mrf.stop_motors()
@@ -217,7 +300,7 @@ class RobotController:
 
         # Display final position
         final_pos = self.odometry.get_position()
-        print(f"📍 Final position: ({final_pos.x:.3f}, {final_pos.y:.3f}, {final_pos.theta*180/3.14159:.1f}°)")
+        print(f"📍 Final position: ({final_pos.x:.3f}, {final_pos.y:.3f}, {final_pos.theta * _RAD2DEG:.1f}°)")
 
         # Calculate distance from origin
         distance_from_origin = self.odometry.calculate_distance_to_point(0, 0)
@@ -231,18 +314,36 @@ class RobotController:
 
         try:
             # Add odometry statistics to log
-            log_data = {
-                'metadata': {
-                    'total_entries': len(self.data_log),
-                    'recording_duration': self.data_log[-1]['timestamp'] - self.data_log[0]['timestamp'] if self.data_log else 0,
-                    'odometry_stats': self.odometry.get_statistics(),
-                    'path_history': self.odometry.export_path_to_dict()
-                },
-                'data': self.data_log
+            metadata = {
+                'total_entries': len(self.data_log),
+                'recording_duration': self.data_log[-1]['timestamp'] - self.data_log[0]['timestamp'] if self.data_log else 0,
+                'odometry_stats': self.odometry.get_statistics(),
+                'path_history': self.odometry.export_path_to_dict()
             }
 
+            # Stream the document entry by entry instead of building and pretty-printing
+            # the whole log in memory; the file layout is unchanged: {"metadata", "data"}
+            encode = json.JSONEncoder(separators=(',', ':')).encode
+            fromtimestamp = datetime.fromtimestamp
+
             with open(filename, 'w') as f:
-                json.dump(log_data, f, indent=2)
+                write = f.write
+                write('{"metadata":')
+                write(encode(metadata))
+                write(',"data":[')
+                separator = ''
+                for entry in self.data_log:
+                    timestamp = entry['timestamp']
+                    write(separator)
+                    write(encode({
+                        'timestamp': timestamp,
+                        'datetime': fromtimestamp(timestamp).isoformat(),
+                        'sensors': entry['sensors'].to_dict(),
+                        'position': entry['position'],
+                        'velocity': entry['velocity']
+                    }))
+                    separator = ',\n'
+                write(']}\n')
 
             print(f"💾 Log data saved to: {filename}")
             print(f"📊 Total entries: {len(self.data_log)}")
@@ -0,0 +1,235 @@
+"""
+Tests for MRF_odometry
+Run from the microRobotFramework_python_04 directory:
+    python -m unittest discover -s tests
+"""
+
+import contextlib
+import io
+import os
+import random
+import sys
+import types
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import MRF_odometry as odometry_module
+
+
+class _FakeClock:
+    """Stand-in for the time module: time() returns the values of a list, in order"""
+
+    def __init__(self, start: float):
+        self.times = []
+        self.now = start
+
+    def time(self) -> float:
+        if self.times:
+            self.now = self.times.pop(0)
+        return self.now
+
+
+class OdometryTestCase(unittest.TestCase):
+    """Runs MRF_odometry against a fake clock"""
+
+    START = 1000.0
+
+    def setUp(self):
+        self.clock = _FakeClock(self.START)
+        self._time = odometry_module.time
+        odometry_module.time = types.SimpleNamespace(time=self.clock.time)
+
+    def tearDown(self):
+        odometry_module.time = self._time
+
+    def _odometry(self) -> odometry_module.MRF_Odometry:
+        with contextlib.redirect_stdout(io.StringIO()):  # The constructor prints its settings
+            return odometry_module.MRF_Odometry()
+
+    def assertSameState(self, sequential, batch):
+        np.testing.assert_allclose(batch.get_pose(), sequential.get_pose(), rtol=0, atol=1e-9)
+        self.assertEqual(batch.position.timestamp, sequential.position.timestamp)
+        np.testing.assert_allclose(
+            [batch.velocity.linear, batch.velocity.angular, batch.velocity.left_wheel, batch.velocity.right_wheel],
+            [sequential.velocity.linear, sequential.velocity.angular,
+             sequential.velocity.left_wheel, sequential.velocity.right_wheel], rtol=1e-9, atol=1e-9)
+        self.assertAlmostEqual(batch.total_distance, sequential.total_distance, places=9)
+        self.assertAlmostEqual(batch.total_rotation, sequential.total_rotation, places=9)
+        self.assertEqual(batch.prev_encoder_left, sequential.prev_encoder_left)
+        self.assertEqual(batch.prev_encoder_right, sequential.prev_encoder_right)
+        self.assertEqual(batch.prev_timestamp, sequential.prev_timestamp)
+        np.testing.assert_allclose(batch._ordered_path(), sequential._ordered_path(), rtol=0, atol=1e-9)
+
+
+class BatchUpdateTest(OdometryTestCase):
+    """update_odometry_batch must match update_odometry called once per sample"""
+
+    def _run_both(self, left, right, times, chunk_sizes):
+        """Feed the samples one by one and in chunks; return (sequential, batch) odometry"""
+        sequential = self._odometry()
+        batch = self._odometry()
+        for encoder_left, encoder_right, sample_time in zip(left, right, times):
+            self.clock.times.append(sample_time)
+            sequential.update_odometry(encoder_left, encoder_right)
+
+        start = 0
+        for size in chunk_sizes:
+            batch.update_odometry_batch(left[start:start + size], right[start:start + size],
+                                        times[start:start + size])
+            start += size
+        self.assertEqual(start, len(left))
+        return sequential, batch
+
+    def test_matches_sequential_updates(self):
+        rng = random.Random(5)
+        left, right, times = [], [], []
+        encoder_left = encoder_right = 0
+        sample_time = self.START
+        for index in range(600):
+            encoder_left = (encoder_left + rng.randint(-50, 400)) & 0xFFFF
+            encoder_right = (encoder_right + rng.choice([rng.randint(-50, 420), 0, 200])) & 0xFFFF
+            if index % 7 == 0:
+                encoder_right = encoder_left  # Straight segment
+            sample_time += rng.choice([0.02, 0.05, 0.0004])  # Some samples closer than 1ms
+            left.append(encoder_left)
+            right.append(encoder_right)
+            times.append(sample_time)
+
+        chunk_sizes = []
+        while sum(chunk_sizes) < len(left):
+            chunk_sizes.append(min(rng.randint(1, 40), len(left) - sum(chunk_sizes)))
+
+        sequential, batch = self._run_both(left, right, times, chunk_sizes)
+        self.assertSameState(sequential, batch)
+        self.assertGreater(abs(batch.position.theta), 0.0)
+
+    def test_skips_samples_within_1ms_of_the_last_applied_one(self):
+        start = self.START
+        left = [10, 20, 30, 40]
+        right = [10, 25, 35, 50]
+        times = [start + 0.0006, start + 0.0012, start + 0.0016, start + 0.0030]
+
+        sequential, batch = self._run_both(left, right, times, [4])
+
+        # 0.6ms: skipped; 1.2ms: applied; 1.6ms: only 0.4ms after 1.2ms, skipped; 3.0ms: applied
+        self.assertEqual(batch._path_count, 2)
+        np.testing.assert_allclose(batch._ordered_path()[:, 3], [start + 0.0012, start + 0.0030])
+        self.assertSameState(sequential, batch)
+
+    def test_encoder_wrap(self):
+        # Both encoders pass 65535 -> 0 going forward and back again going backward
+        left = [65500, 40, 120, 65530, 65400]
+        right = [65510, 60, 100, 5, 65450]
+        left_start, right_start = 65400, 65450
+        times = [self.START + 0.02 * (index + 1) for index in range(len(left))]
+
+        sequential = self._odometry()
+        batch = self._odometry()
+        for odometry in (sequential, batch):
+            odometry.prev_encoder_left = left_start
+            odometry.prev_encoder_right = right_start
+        for encoder_left, encoder_right, sample_time in zip(left, right, times):
+            self.clock.times.append(sample_time)
+            sequential.update_odometry(encoder_left, encoder_right)
+        self.assertEqual(batch.update_odometry_batch(left, right, times), len(left))
+
+        self.assertSameState(sequential, batch)
+        # Forward 176 + 80 pulses, then back the same distance: no jump of 65536 pulses
+        self.assertLess(batch.total_distance, 1.0)
+
+    def test_without_timestamps_spreads_the_batch_up_to_now(self):
+        odometry = self._odometry()
+        self.clock.times.append(self.START + 0.3)
+        self.assertEqual(odometry.update_odometry_batch([10, 20, 30], [10, 20, 30]), 3)
+
+        np.testing.assert_allclose(odometry._ordered_path()[:, 3], [self.START + 0.1, self.START + 0.2, self.START + 0.3])
+        self.assertEqual(odometry.prev_timestamp, self.START + 0.3)
+
+    def test_rejects_mismatched_lengths(self):
+        odometry = self._odometry()
+        with self.assertRaises(ValueError):
+            odometry.update_odometry_batch([1, 2], [1])
+        with self.assertRaises(ValueError):
+            odometry.update_odometry_batch([1, 2], [1, 2], [self.START + 1.0])
+        self.assertEqual(odometry.update_odometry_batch([], []), 0)
+
+
+class PathHistoryTest(OdometryTestCase):
+    """Path ring buffer: the newest max_path_length positions, oldest first"""
+
+    def _record(self, odometry, xs):
+        """Record one position per x, along the x axis with timestamp = x"""
+        for x in xs:
+            odometry.position.x = float(x)
+            odometry.position.timestamp = float(x)
+            odometry._record_position()
+
+    def test_before_wrap(self):
+        odometry = self._odometry()
+        self._record(odometry, range(3))
+
+        rows = list(odometry.iter_path())
+        self.assertEqual([row.tolist() for row in rows], [[x, 0.0, 0.0, x] for x in (0.0, 1.0, 2.0)])
+        self.assertTrue(np.shares_memory(odometry._ordered_path(), odometry._path))  # No copy yet
+        self.assertEqual(odometry.get_path_length(), 2.0)
+
+    def test_oldest_positions_are_overwritten(self):
+        odometry = self._odometry()
+        size = odometry.max_path_length
+        self._record(odometry, range(size + 3))
+
+        expected = list(range(3, size + 3))
+        self.assertEqual(odometry._path_count, size)
+        self.assertEqual(odometry._ordered_path()[:, 0].tolist(), expected)
+        self.assertEqual([row[0] for row in odometry.iter_path()], expected)
+        self.assertEqual(odometry.get_path_length(), size - 1)
+        history = odometry.get_path_history()
+        self.assertEqual((history[0].x, history[-1].timestamp), (3.0, size + 2.0))
+        self.assertEqual(odometry.export_path_to_dict()[0]['x'], 3.0)
+
+    def test_rows_are_read_only(self):
+        odometry = self._odometry()
+        self._record(odometry, range(2))
+
+        row = next(odometry.iter_path())
+        with self.assertRaises(ValueError):
+            row[0] = 5.0
+
+    def test_record_positions_wraps_like_single_records(self):
+        single = self._odometry()
+        bulk = self._odometry()
+        size = single.max_path_length
+        self._record(single, range(size + 5))
+        self._record(bulk, range(size - 2))
+        rows = np.array([[x, 0.0, 0.0, x] for x in range(size - 2, size + 5)])
+
+        bulk._record_positions(rows)
+
+        self.assertEqual(bulk._path_head, single._path_head)
+        np.testing.assert_array_equal(bulk._ordered_path(), single._ordered_path())
+
+    def test_record_positions_longer_than_the_buffer(self):
+        odometry = self._odometry()
+        size = odometry.max_path_length
+        self._record(odometry, range(10))
+        rows = np.array([[x, 0.0, 0.0, x] for x in range(2 * size + 7)])
+
+        odometry._record_positions(rows)
+
+        self.assertEqual(odometry._ordered_path()[:, 0].tolist(), list(range(size + 7, 2 * size + 7)))
+
+    def test_reset_clears_the_path(self):
+        odometry = self._odometry()
+        self._record(odometry, range(5))
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            odometry.reset_odometry()
+
+        self.assertEqual(list(odometry.iter_path()), [])
+        self.assertEqual(odometry.get_path_length(), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
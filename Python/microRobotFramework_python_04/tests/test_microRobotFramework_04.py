@@ -0,0 +1,172 @@
+"""
+Tests for microRobotFramework_04
+Run from the microRobotFramework_python_04 directory:
+    python -m unittest discover -s tests
+"""
+
+import contextlib
+import io
+import os
+import struct
+import sys
+import time
+import unittest
+
+import serial
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import microRobotFramework_04 as mrf_module
+
+
+def _frame(values) -> bytes:
+    """
+    Build a sensor frame the way mpu6050_get_raw_data_04.ino sends it (21 bytes):
+    data[0] = 0xF5, data[1..20] = 6 int16 IMU + 4 uint16 encoder values, high byte first
+    """
+    return b'\xf5' + struct.pack('>6h4H', *values)
+
+
+def _loop_serial(**kwargs) -> serial.Serial:
+    """Stand-in for serial.Serial: a loopback port that reads back what is written"""
+    return serial.serial_for_url('loop://', timeout=kwargs.get('timeout', 0.1))
+
+
+class LoopbackTestCase(unittest.TestCase):
+    """Runs an MRF on a loop:// port; bytes written with send() are received by the MRF"""
+
+    def setUp(self):
+        self._serial = mrf_module.serial.Serial
+        mrf_module.serial.Serial = _loop_serial
+        self.mrf = mrf_module.MRF('loop://', 115200)
+        self.assertTrue(self.mrf.is_connected())
+
+    def tearDown(self):
+        self.mrf.close_connection()
+        mrf_module.serial.Serial = self._serial
+
+    def send(self, data: bytes) -> None:
+        self.mrf.serial_connection.write(data)
+
+    def receive_all(self):
+        """Parse every complete frame; return a snapshot of each"""
+        snapshots = []
+        self.mrf._receive_frames(lambda: snapshots.append(self.mrf.snapshot()))
+        return snapshots
+
+
+class ReceiveTest(LoopbackTestCase):
+    """receive_sensor_data: a frame is parsed once the next frame's header follows it"""
+
+    def test_parses_signed_imu_and_unsigned_encoders(self):
+        values = [-1, 2, -32768, 32767, 5, -6, 0, 65535, 40000, 9]
+        self.send(_frame(values) + b'\xf5')
+
+        self.assertTrue(self.mrf.receive_sensor_data())
+        self.assertEqual(list(self.mrf.snapshot()), values)
+        self.assertEqual((self.mrf.get_accel_x(), self.mrf.get_encoder2()), (-1, 65535))
+        self.assertEqual(self.mrf.get_encoder_vec().tolist(), values[6:])
+
+    def test_waits_for_the_next_header(self):
+        self.send(_frame(range(10)))
+        self.assertFalse(self.mrf.receive_sensor_data())  # Times out: the frame isn't confirmed yet
+
+        self.send(b'\xf5')
+        self.assertTrue(self.mrf.receive_sensor_data())
+        self.assertEqual(self.mrf.get_encoder4(), 9)
+
+    def test_frame_split_across_reads(self):
+        frame = _frame(range(20, 30))
+        self.send(frame[:8])
+        self.assertFalse(self.mrf.receive_sensor_data())
+
+        self.send(frame[8:] + b'\xf5')
+        self.assertTrue(self.mrf.receive_sensor_data())
+        self.assertEqual(self.mrf.get_accel_x(), 20)
+
+    def test_every_waiting_frame_is_parsed(self):
+        self.send(b'\x00\x01' + _frame(range(10)) + _frame(range(10, 20)) + _frame(range(20, 30)) + b'\xf5')
+
+        snapshots = self.receive_all()
+
+        self.assertEqual([snapshot.ax for snapshot in snapshots], [0, 10, 20])
+        self.assertEqual(self.mrf.get_accel_x(), 20)  # The getters hold the latest frame
+
+    def test_header_byte_inside_the_data(self):
+        # Start mid-frame: the rest of that frame holds a 0xF5 that isn't a frame header
+        leftover = _frame([0, 0, 0, 0, 0, 0xF5, 0, 0, 0, 0])[3:]
+        values = [1, 2, 3, 0xF5, 5, 6, 7, 0xF500, 9, 10]
+        self.send(leftover + _frame(values) + _frame(range(10)) + b'\xf5')
+
+        snapshots = self.receive_all()
+
+        self.assertEqual([list(snapshot) for snapshot in snapshots], [values, list(range(10))])
+
+    def test_lost_byte_only_costs_its_frame(self):
+        damaged = bytearray(_frame(range(10, 20)))
+        del damaged[5]
+        self.send(_frame(range(10)) + bytes(damaged) + _frame(range(20, 30)) + b'\xf5')
+
+        snapshots = self.receive_all()
+
+        self.assertEqual([snapshot.ax for snapshot in snapshots], [0, 20])
+
+    def test_read_error_drops_the_connection(self):
+        self.mrf.serial_connection.close()
+
+        with contextlib.redirect_stdout(io.StringIO()):  # The error is printed
+            self.assertFalse(self.mrf.receive_sensor_data())
+        self.assertFalse(self.mrf.is_connected())
+        self.assertFalse(self.mrf.send_motor_command(50, 0))
+
+
+class ReceiverThreadTest(LoopbackTestCase):
+    """start_receiver: (receive time, SensorSnapshot) pairs in rx_snapshots"""
+
+    def test_pushes_every_frame_with_its_receive_time(self):
+        # Queue the frames first, so the receiver parses them in one call
+        self.send(_frame(range(10)) + _frame(range(10, 20)) + b'\xf5')
+        before = time.time()
+
+        self.assertTrue(self.mrf.start_receiver())
+        self.assertTrue(self.mrf.new_data_event.wait(timeout=5))
+        self.mrf.stop_receiver()
+
+        received = list(self.mrf.rx_snapshots)
+        self.assertEqual([snapshot for _, snapshot in received],
+                         [mrf_module.SensorSnapshot(*range(10)), mrf_module.SensorSnapshot(*range(10, 20))])
+        times = [stamp for stamp, _ in received]
+        self.assertEqual(times, sorted(times))
+        self.assertTrue(before <= times[0] <= times[-1] <= time.time())
+
+    def test_stops_when_the_port_closes(self):
+        self.assertTrue(self.mrf.start_receiver())
+        thread = self.mrf._rx_thread
+
+        self.mrf.serial_connection.close()
+        thread.join(timeout=5)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(len(self.mrf.rx_snapshots), 0)
+
+    def test_not_started_without_a_connection(self):
+        self.mrf.close_connection()
+
+        self.assertFalse(self.mrf.start_receiver())
+
+
+class SensorSnapshotTest(unittest.TestCase):
+    """SensorSnapshot fields and nested dictionary"""
+
+    def test_to_dict(self):
+        snapshot = mrf_module.SensorSnapshot(1, 2, 3, 4, 5, 6, 7, 8, 9, 10)
+
+        self.assertEqual(snapshot.to_dict(), {
+            'accel': {'x': 1, 'y': 2, 'z': 3},
+            'gyro': {'x': 4, 'y': 5, 'z': 6},
+            'encoders': {'encoder1': 7, 'encoder2': 8, 'encoder3': 9, 'encoder4': 10},
+        })
+        self.assertEqual((snapshot.gz, snapshot.e1), (6, 7))
+
+
+if __name__ == '__main__':
+    unittest.main()